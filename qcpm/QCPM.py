@@ -1,11 +1,19 @@
 import os
 import sys
 from contextlib import contextmanager
+from copy import deepcopy
+from functools import partial
+from time import time
+from math import ceil
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 from qcpm.pattern import Mapper
 from qcpm.circuit import Circuit
+from qcpm.preprocess import prescan
 from qcpm.common import Timer
-from qcpm.statistics import StatReporter
+from qcpm.statistics import StatReporter, Manifest, hashFile, hashConfig
 from qcpm.config import QCPMConfig
 
 
@@ -58,8 +66,20 @@ class QCPatternMapper:
 
         # 2. dir to dir (batch work)
         QCPM.execute('./data/', './output/', strategy='MCM')
+
+        # 3. bounded latency: 10s each file, 60s all files
+        QCPM.execute('./data/', './output/', strategy='auto', time_budget=10, batch_budget=60)
+
+        # 4. dir to dir by 4 processes
+        QCPM.execute('./data/', './output/', workers=4)
     
     """
+    # depth_size => depth where prescan could stop (the depth size is decided)
+    ## small: depth > 100 => not small, medium: depth >= 1000 => large
+    DEPTH_STOP = { 'small': 101, 'medium': 1000, 'large': 1000 }
+
+    # strategy='auto' escalation: greedy -> MCM -> exact(beam search without width limit)
+    ESCALATION = [ (None, {}), ('MCM', {}), ('beam', { 'beam_width': None }) ]
 
     def __init__(self, **kwargs):
         """ 
@@ -85,13 +105,58 @@ class QCPatternMapper:
         """
         # init config object
         self.config = QCPMConfig(kwargs)
+        self.batch = None # (deadline, number of rest files) in batch work
 
         self._execute(input_path, output_path)
 
         # destroy config object
         self.config = None
 
-    def _execute(self, input_path, output_path=''):
+    def deadline(self):
+        """ deadline of executing current file
+
+        according to config.time_budget and the rest of config.batch_budget
+        (shared equally by the rest files).
+
+        Returns:
+            deadline: time.time() when executing should stop. None => no limit
+        """
+        deadlines = []
+
+        if self.config.time_budget is not None:
+            deadlines.append(time() + self.config.time_budget)
+
+        if self.batch is not None:
+            batch_deadline, rest = self.batch
+            deadlines.append(time() + max(batch_deadline - time(), 0) / rest)
+
+        return min(deadlines) if len(deadlines) != 0 else None
+
+    def score(self, circuit):
+        """ score (lower is better) used to compare circuits by metric
+
+        """
+        info = circuit.info
+        
+        return (info.depth if self.config.metric == 'depth' else info.cycle, info.size)
+
+    def checkDepthSize(self, input_path):
+        """ check depth size of the origin circuit before loading it
+
+        by a streaming prescan, which stops once the depth size is decided.
+        
+        Raises:
+            DepthSizeError: depth size dismatches config.depth_size
+        """
+        if self.config.depth_size == 'all':
+            return
+
+        scan = prescan(input_path, stop=self.DEPTH_STOP[self.config.depth_size])
+        if scan['depth_size'] != self.config.depth_size:
+            # stopped => depth is a lower bound, eg. 'medium' => medium or large
+            raise DepthSizeError(scan['depth_size'] + ('' if scan['complete'] else '(or larger)'))
+
+    def _execute(self, input_path, output_path='', checked=False):
         """ apply mapper on target circuit.
 
         If input path is dir => call self._executeDir
@@ -99,6 +164,11 @@ class QCPatternMapper:
         Args:
             input_path: qasm file's path or may be qasm files' dir path.
             output_path: default='' means no output.
+            checked: depth size is already checked (by _executeDir).
+        -------
+        Returns:
+            row of statistic reporter: (filename, circuitInfos, time)
+                None when input_path is a dir.
         """
         # if input_path is a folder path => batch work model
         if os.path.isdir(input_path):
@@ -112,9 +182,15 @@ class QCPatternMapper:
             # eg. system = 'Surface'
             system_input = system_output = self.config.system
         
+        # check depth size before loading circuit
+        if not checked:
+            self.checkDepthSize(input_path)
+
         timer = Timer()
         timer.silence = True
 
+        deadline = self.deadline()
+
         with logging(self.log):
             with timer:
                 # execute turns limit.
@@ -123,28 +199,62 @@ class QCPatternMapper:
                 # 1. optimization: reduction -> commutation ...(×n)... -> reduction
                 # 2. pattern mapping: mapper.execute(circuit)
                 # 
+                # with time budget => turns are limited by deadline instead.
                 LIMIT = 5
 
+                # each turn simulates with its own seed spawned from config.seed
+                seeds = np.random.SeedSequence(self.config.seed)
+
+                # strategy='auto' => escalate when current strategy changes nothing
+                strategies = self.ESCALATION if self.config.strategy == 'auto' \
+                    else [ (self.config.strategy, {}) ]
+                stage = 0
+
+                def mapping(circuit):
+                    strategy, options = strategies[stage]
+                    options = { 
+                        'system': system_input, 'strategy': strategy, 'metric': self.config.metric,
+                        'seed': seeds.spawn(1)[0], 'simulation_workers': self.config.simulation_workers,
+                        'iterations': self.config.iterations, 'search_time': self.config.search_time,
+                        'beam_width': self.config.beam_width, 'deadline': deadline, **options 
+                    }
+
+                    return self.mapper.execute(circuit, **options)
+
                 turn = 1
                 # first turn should initial circuit(default call optimization.)
                 circuit = Circuit(input_path, system=system_input, optimize=self.config.optimize)
-
-                # after loading circuir, check the depth size
-                circuit_depth_size = circuit.origin.depth_size
-                if self.config.depth_size != 'all' and circuit_depth_size != self.config.depth_size:
-                    raise DepthSizeError(circuit_depth_size)
                 
-                changed = self.mapper.execute(circuit, 
-                    system=system_input, strategy=self.config.strategy, metric=self.config.metric)
-
-                while changed and turn < LIMIT:
-                    self.config.optimize and circuit.optimize()
+                # with time budget => keep the best circuit found so far
+                best = None if deadline is None else deepcopy(circuit)
+
+                changed = mapping(circuit)
+
+                while (turn < LIMIT) if deadline is None else (time() < deadline):
+                    if changed:
+                        self.config.optimize and circuit.optimize()
+                    elif stage + 1 < len(strategies):
+                        stage += 1
+                        print(f'\nEscalate strategy: {strategies[stage][0]}\n')
+                    else:
+                        break
+
+                    if best is not None and self.score(circuit) < self.score(best):
+                        best = deepcopy(circuit)
                     
-                    changed = self.mapper.execute(circuit,
-                        system=system_input, strategy=self.config.strategy, metric=self.config.metric)
+                    changed = mapping(circuit)
 
                     turn += 1
 
+                if best is not None:
+                    if changed:
+                        self.config.optimize and circuit.optimize()
+
+                    if self.score(best) < self.score(circuit):
+                        print('\nRestore the best circuit found within time budget.\n')
+                        circuit = best
+                        self.mapper.circuit = circuit
+
                 if output_path != '':
                     # save qasm file (after mapping)
                     circuit.save(output_path, system=system_output)
@@ -152,17 +262,23 @@ class QCPatternMapper:
                 self.mapper.result()
             # end of timer
         # end of logger
-        
-        if self.reporter != None:
-            # statistic reporter: (filename, circuitInfos, time)
-            self.reporter.add(input_path, [circuit.origin, circuit.info], timer.duration)
 
         print(circuit)
 
+        # statistic reporter: (filename, circuitInfos, time)
+        return input_path, [circuit.origin, circuit.info], timer.duration
+
     def _executeDir(self, input_dir, output_dir):
         """ execute when call batch work form dir to dir.
 
         Iterately call [self.execute] to execute.
+        with config.workers > 1, files are executed by a process pool,
+        each process keeps its own warm QCPatternMapper(Mapper).
+        rows of statistic reporter are still added in order of files.
+
+        with config.resume, done files are recorded in output_dir/manifest.json
+        (see Manifest), files done with the same input/config/rules are skipped
+        and their rows are reported from the manifest.
 
         Args:
             input_dir/output_dir: file folder path. (from => to)
@@ -172,27 +288,133 @@ class QCPatternMapper:
         self.reporter = StatReporter(self.config.stat_path, 
             metric=self.config.metric, folder=input_dir, config=self.config)
 
-        for i, file in enumerate(os.listdir(input_dir)):
+        # manifest => only kept with config.resume
+        manifest = config = None
+        if self.config.resume:
+            manifest = Manifest(output_dir)
+            config = hashConfig(self.config)
+
+        # sorted => the same order of files (and rows) in each run
+        files = sorted( file for file in os.listdir(input_dir) if file.endswith('.qasm') )
+
+        tasks = []
+        for file in files:
             # eg. 'example.qasm'
             # filename => 'example'
             filename = os.path.splitext(file)[0]
             # output_name => 'example_output'
             output_name = f'{filename}_output'
-            
-            print(f'solving {i + 1}-th file <{input_dir}{filename}.qasm>...', sep='')
 
-            # default log file will be ./log/example_log.txt
-            self.log = f'{self.logs}{filename}_log.txt'
-            
+            input_path = os.path.join(input_dir, f'{filename}.qasm')
+            digest = entry = None
+            if manifest is not None:
+                digest = hashFile(input_path)
+                entry = manifest.done(file, digest, config)
+
+            tasks.append({
+                'file': file, 'filename': filename, 'output_name': output_name, 
+                'digest': digest, 'entry': entry, 'batch': None, 'ignored': None,
+                'input_path': input_path,
+                'output_path': os.path.join(output_dir, f'{output_name}.qasm'),
+                # default log file will be ./log/example_log.txt
+                'log': f'{self.logs}{filename}_log.txt'
+            })
+
+        # files to execute (not done before)
+        pending = []
+        for task in tasks:
+            if task['entry'] is not None:
+                continue
+
+            # check depth size before any heavy work (loading/dispatching to workers)
             try:
-                # call self.execute to solve single file.
-                self._execute(
-                    os.path.join(input_dir, f'{filename}.qasm'),
-                    os.path.join(output_dir, f'{output_name}.qasm'),
-                )
+                self.checkDepthSize(task['input_path'])
+                pending.append(task)
+            except DepthSizeError as e:
+                task['ignored'] = e
+
+        workers = self.config.workers
+        if self.config.batch_budget is not None:
+            batch_deadline = time() + self.config.batch_budget
+
+            for i, task in enumerate(pending):
+                # rest files are shared by workers
+                task['batch'] = (batch_deadline, ceil((len(pending) - i) / (workers or os.cpu_count())))
+
+        def report(i, task, execute):
+            print(f'solving {i + 1}-th file <{input_dir}{task["filename"]}.qasm>...', sep='')
+
+            entry = task['entry']
+            if entry is not None:
+                if entry['ignored'] is not None:
+                    print(f'-- depth size: [{entry["ignored"]}] IGNORE it.\n')
+                else:
+                    print(f'-- unchanged since last work, output: <{output_dir}{task["output_name"]}>. SKIP it.\n')
+
+                    self.reporter.addRow(entry['row'])
+                return
+
+            def record(**kwargs):
+                if manifest is not None:
+                    manifest.record(task['file'], task['digest'], config, 
+                        task['output_path'], task['log'], **kwargs)
+            try:
+                if task['ignored'] is not None:
+                    raise task['ignored']
+
+                row = execute()
+
+                print(f'-- finished! output: <{output_dir}{task["output_name"]}>.')
+                print(f'---- log file in [{task["log"]}].\n')
 
-                print(f'-- finished! output: <{output_dir}{output_name}>.')
-                print(f'---- log file in [{self.log}].\n')
+                record(row=self.reporter.add(*row))
 
             except DepthSizeError as e:
                 print(f'-- depth size: [{e}] IGNORE it.\n')
+
+                record(ignored=str(e))
+
+        if workers == 1 or len(pending) == 0:
+            for i, task in enumerate(tasks):
+                self.batch, self.log = task['batch'], task['log']
+
+                # call self.execute to solve single file.
+                report(i, task, partial(self._execute, task['input_path'], task['output_path'], checked=True))
+
+            return
+
+        with ProcessPoolExecutor(max_workers=workers, 
+                initializer=_initWorker, initargs=(self.logs,)) as pool:
+            futures = { task['file']: pool.submit(_executeFile, self.config, 
+                task['batch'], task['input_path'], task['output_path'], task['log']) for task in pending }
+
+            for i, task in enumerate(tasks):
+                future = futures.get(task['file'])
+                report(i, task, future and future.result)
+
+
+##########################
+#                        #
+#     Worker process     #
+#                        #
+##########################
+
+_worker = None # QCPatternMapper of worker process, set by _initWorker
+
+def _initWorker(logs):
+    # warm QCPatternMapper(Mapper) kept by each worker process
+    global _worker
+    _worker = QCPatternMapper(logs=logs)
+
+def _executeFile(config, batch, input_path, output_path, log):
+    """ execute single file of batch work in worker process
+
+    Returns:
+        row of statistic reporter: (filename, circuitInfos, time)
+    """
+    _worker.config = config
+    _worker.batch = batch
+    _worker.log = log
+
+    # depth size is checked by _executeDir before dispatching
+    return _worker._execute(input_path, output_path, checked=True)
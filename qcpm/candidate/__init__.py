@@ -2,6 +2,9 @@ from qcpm.candidate.candidate import Candidate
 from qcpm.candidate.greedy import GreedySearchPlan
 from qcpm.candidate.search import SearchPlan
 from qcpm.candidate.random import RandomlySearchPlan
+from qcpm.candidate.mcts import MCTSSearchPlan
+from qcpm.candidate.beam import BeamSearchPlan
 from qcpm.candidate.plan import Plan, Plans
+from qcpm.candidate.depth import evaluateDepth
 
-__all__ = ['Candidate', 'GreedySearchPlan', 'RandomlySearchPlan', 'SearchPlan', 'Plan', 'Plans']
\ No newline at end of file
+__all__ = ['Candidate', 'GreedySearchPlan', 'RandomlySearchPlan', 'SearchPlan', 'MCTSSearchPlan', 'BeamSearchPlan', 'Plan', 'Plans', 'evaluateDepth']
\ No newline at end of file
@@ -0,0 +1,84 @@
+from time import time
+
+from qcpm.candidate.plan import Plan, Plans
+
+
+def BeamSearchPlan(circuit, candidates, metric, width=8, deadline=None):
+    """ beam search to generate Plans.
+
+    args are corresponding to the args in SearchPlan(circuit, candidates, metric):
+
+    walk along the sorted candidates and extend each partial plan
+    by including (if no conflict) or skipping current candidate,
+    then keep the [width] best partial plans.
+
+    partial plans with the same frontier (used positions that later
+    candidates may still conflict with) are equivalent for the rest of
+    candidates, thus only the one with max saving is kept.
+
+    with a [deadline], searching stops once it's reached,
+    and the rest candidates are skipped by the partial plans in beam
+    (the best plans found so far).
+
+    Args: 
+        circuit: Circuit object, just may be used in calculate delta_depth.
+        candidates: list of Candidate object sorted by begin.
+        metric: cycle or depth which used to calculate value of candidate.
+        width: beam width. None => no limit (exact searching).
+        deadline: time.time() when searching should stop. default None(no limit)
+    -------
+    Returns:
+        Plans object contains the final partial plans in beam.
+    """
+    # beam: frontier(frozenset) => (saving, selected)
+    beam = { frozenset(): (0, []) }
+
+    def timeout():
+        return deadline is not None and time() >= deadline
+
+    for i, candidate in enumerate(candidates):
+        if timeout():
+            print(f'Beam search stopped by deadline at {i}-th candidate.')
+            break
+
+        # later candidates' positions are all >= next_begin
+        next_begin = candidates[i + 1].begin if i + 1 < len(candidates) else None
+        pos = set(candidate.pos)
+        value = candidate.delta(metric, circuit)
+
+        states = {}
+        def extend(used, saving, selected):
+            if next_begin is None:
+                frontier = frozenset()
+            else:
+                frontier = frozenset(p for p in used if p >= next_begin)
+
+            # dominated state => ignore
+            if frontier not in states or states[frontier][0] < saving:
+                states[frontier] = (saving, selected)
+
+        stopped = False
+        for used, (saving, selected) in beam.items():
+            if timeout():
+                stopped = True
+                break
+
+            # include current candidate
+            if used.isdisjoint(pos):
+                extend(used | pos, saving + value, selected + [candidate])
+            # skip current candidate
+            extend(used, saving, selected)
+
+        # deadline reached while extending => keep the beam before current candidate
+        if stopped:
+            print(f'Beam search stopped by deadline at {i}-th candidate.')
+            break
+
+        # keep [width] best partial plans (stable: include first)
+        ordered = sorted(states.items(), key=lambda state: state[1][0], reverse=True)
+        beam = dict(ordered if width is None else ordered[:width])
+
+    plans = Plans([ Plan(selected, saving) for saving, selected in beam.values() ])
+    print(plans)
+
+    return plans
@@ -1,7 +1,42 @@
 from itertools import zip_longest
-from copy import copy, deepcopy
 
 from qcpm.operator import Operator
+
+
+##########################
+#                        #
+#     Tool Functions     #
+#                        #
+##########################
+
+def _sweep(layers, operands_list):
+    """ sweep operators on per-qubit layers (like CircuitInfo.compute_depth)
+
+    Args:
+        layers: dict qubit => depth, will be updated.
+        operands_list: iterator of operands of each operator.
+    -------
+    Returns:
+        depth: max depth of all qubits after sweeping.
+    """
+    for opds in operands_list:
+        if len(opds) == 1:
+            layers[ opds[0] ] = layers.get(opds[0], 0) + 1
+        else:
+            layer = max(layers.get(opd, 0) for opd in opds) + 1
+
+            for opd in opds:
+                layers[opd] = layer
+
+    return max(layers.values(), default=0)
+
+
+############################
+#                          #
+#     Class Definition     #
+#                          #
+############################
+
 class Candidate:
     """ Candidate object that contains mapped gates' positions etc.
 
@@ -94,50 +129,33 @@ class Candidate:
     def delta_depth(self, circuit):
         """ calculate the delta depth after apply this candidate in a sub circuit.
 
+        sub circuit is circuit[begin - SUB_SIZE: end + SUB_SIZE + 1],
+        the same as evaluateDepth (qcpm.candidate.depth), which Mapper uses
+        to evaluate all candidates together in advance;
+        a candidate not evaluated yet is evaluated alone here.
+            => delta = depth_after - depth_before + 1
+
         Args:
             circuit: a Circuit object corresponding to the total circuit
-                => will cut a sub-circuit to calculate delta_depth value.
         """
-        if '_depth' in self.__dict__:
-            return self._depth
-
-        # sub size before and after circuit
-        SUB_SIZE = 20
-
-        # Step 1. cut sub-circuit
-        sub_circuit = copy(circuit)
-        sub_begin = self.begin - SUB_SIZE if self.begin - SUB_SIZE>= 0 else 0
-        sub_end = self.end + SUB_SIZE if self.end + SUB_SIZE < len(circuit) else len(circuit) - 1
-        sub_circuit.operators = deepcopy(circuit[sub_begin:sub_end + 1])
-
-        # Step 2. adjust the candidate's position according to the new beginning of subcircuit
-        self.begin -= sub_begin
-        self.end -= sub_begin
-        self.pos = [p - sub_begin for p in self.pos]
-
-        # Step 3. apply this candidate on subcircuit to calculate delta of depth
-        depth_before = sub_circuit.depth
-        self.apply(sub_circuit, silence=True)
-        depth_after = sub_circuit.depth
+        if '_depth' not in self.__dict__:
+            # avoid circular import: depth => candidate
+            from qcpm.candidate.depth import evaluateDepth
 
-        # Step 4. ! recover the origin positions
-        self.begin += sub_begin
-        self.end += sub_begin
-        self.pos = [p + sub_begin for p in self.pos]
-
-        # Step 5. calculate self delta_depth and memoize it.
-        self._depth = depth_after - depth_before + 1
+            # memoize self._depth
+            evaluateDepth(circuit, [self])
 
         return self._depth
 
-    def apply(self, circuit, silence=False):
-        """ apply this candidated-mapping in the Circuit.
-
-        called by Mapper.execute => Plans.apply
+    def changes(self, circuit):
+        """ changes of operators when applying this candidate
 
         Args:
             circuit: Circuit object
-            silence: [True] that ignore the apply info output. default [False].
+        -------
+        Returns:
+            iterator of (position, op_to, operands, angle_to)
+                => op_to may be Operator.ABANDON
         """
         # example 1:
         # --------------------
@@ -158,9 +176,6 @@ class Candidate:
         operands_to = self.pattern.dst['operands']
         angles_to = self.pattern.angles[1]
 
-        # Output apply info.
-        silence or print('Apply: ', self.__repr__())
-
         for i, (op_from, op_to, angle_to) in enumerate(zip_longest(ops_from, ops_to, angles_to)):
             # eg. h => 1, c => 2 ...
             size = Operator.count_qubits(op_to)
@@ -171,11 +186,29 @@ class Candidate:
             if op_to == None:
                 op_to = Operator.ABANDON
             
+            yield self.pos[i], op_to, operands, angle_to
+
+            cur += size
+
+    def apply(self, circuit, silence=False):
+        """ apply this candidated-mapping in the Circuit.
+
+        called by Mapper.execute => Plans.apply
+
+        Args:
+            circuit: Circuit object
+            silence: [True] that ignore the apply info output. default [False].
+        """
+        # Output apply info.
+        silence or print('Apply: ', self.__repr__())
+
+        # all changes are gathered before changing the circuit
+        for position, op_to, operands, angle_to in list(self.changes(circuit)):
             # apply => change this operator in circuit.
-            circuit[self.pos[i]].change(
+            #   => recorded by circuit's transaction (if exists)
+            circuit.change(
+                position,
                 op_to, # new operator
                 operands,
                 angle_to
             )
-
-            cur += size
\ No newline at end of file
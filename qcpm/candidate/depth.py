@@ -0,0 +1,60 @@
+from qcpm.operator import Operator
+from qcpm.candidate.candidate import _sweep
+
+
+# sub size before and after candidate
+SUB_SIZE = 20
+
+def evaluateDepth(circuit, candidates):
+    """ calculate delta_depth of all candidates together.
+
+    delta depth is the depth change of a sub circuit (as Candidate.delta_depth):
+        circuit[begin - SUB_SIZE: end + SUB_SIZE + 1]
+    its depth is swept on per-qubit layers through CircuitView (without copying operators),
+    the candidate's operators are replaced by their operands after applying.
+        => (abandoned operators keep their operands, like in Operator.change)
+
+    sub circuits are decided by (begin, end) of candidates, thus candidates with
+    the same begin share the layers before them, and candidates with the same
+    (begin, end) share the depth before applying.
+
+    values are memoized in candidates: delta = depth_after - depth_before + 1
+
+    Args:
+        circuit: Circuit object.
+        candidates: list of Candidate object.
+    """
+    prefixes = {} # begin => layers of sub circuit before the candidate
+    befores = {} # (begin, end) => depth of sub circuit before applying
+
+    for candidate in candidates:
+        if '_depth' in candidate.__dict__:
+            continue
+
+        begin, end = candidate.begin, candidate.end
+
+        # Step 1. range of sub-circuit
+        sub_begin = begin - SUB_SIZE if begin - SUB_SIZE >= 0 else 0
+        sub_end = end + SUB_SIZE if end + SUB_SIZE < len(circuit) else len(circuit) - 1
+
+        # Step 2. operands of changed operators after applying
+        # eg. {4: [1, 2]} => circuit[4] will become an operator on q[1], q[2]
+        changed = { position: operands for position, op_to, operands, _ in candidate.changes(circuit)
+            if op_to != Operator.ABANDON }
+
+        # Step 3. sweep layers before the candidate (shared by before / after)
+        if begin not in prefixes:
+            prefixes[begin] = {}
+            _sweep(prefixes[begin], (op.operands for op in circuit.view(sub_begin, begin - sub_begin)))
+
+        rest = circuit.view(begin, sub_end - begin + 1)
+
+        # Step 4. sweep the rest of sub-circuit
+        if (begin, end) not in befores:
+            befores[begin, end] = _sweep(dict(prefixes[begin]), (op.operands for op in rest))
+
+        depth_after = _sweep(dict(prefixes[begin]),
+            (changed.get(i, op.operands) for i, op in enumerate(rest, begin)))
+
+        # Step 5. calculate delta_depth and memoize it.
+        candidate._depth = depth_after - befores[begin, end] + 1
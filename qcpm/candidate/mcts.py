@@ -0,0 +1,311 @@
+import math
+from time import time
+
+import numpy as np
+
+from qcpm.candidate.plan import Plan, Plans
+
+
+class Node:
+    """ Node of the search tree, corresponding to a partial plan.
+
+    state of a node:
+        cursor: index of the first candidate that still may be selected.
+        used: positions used by the selected candidates.
+
+    children are created when expanding the node, one child for each
+    target in [targets] (the candidates conflicting with candidates[cursor]).
+    """
+    def __init__(self, searcher, cursor, used, *, parent=None, index=None):
+        self.parent = parent
+        self.index = index # index of the candidate selected to reach this node
+
+        self.cursor = searcher.advance(cursor, used)
+        self.used = used
+        self.targets = searcher.expansion(self.cursor, used) # [] => terminal node
+
+        self.children = {} # target(index of candidate) => Node
+        self.visits = 0
+        self.total = 0 # sum of the rewards(total saving) backpropagated
+
+    @property
+    def terminal(self):
+        return len(self.targets) == 0
+
+    @property
+    def expanded(self):
+        return len(self.children) == len(self.targets)
+
+    @property
+    def mean(self):
+        return self.total / self.visits if self.visits != 0 else 0
+
+
+############################
+#                          #
+#     Class Definition     #
+#                          #
+############################
+
+class MCTSSearchPlan:
+    """ UCT Monte Carlo tree search plan searching
+
+    callable class:
+        MCTSSearchPlan(circuit, candidates, metric)() => return Plans.
+
+    each decision selects one candidate in a conflict group (like SearchPlan),
+    but keeps a search tree over these decisions:
+        1. selection: walk down the tree by UCT.
+        2. expansion: add one unexpanded child.
+        3. simulation: rollout to the end of candidates.
+        4. backpropagation: rewards is the total saving of the complete plan.
+
+    after a decision the selected child becomes the new root, thus
+    its subtree(statistics) is reused by the next decision.
+    """
+    ITERATIONS = 100 # iterations of each decision
+    EXPLORATION = math.sqrt(2)
+
+    def __init__(self, circuit, candidates, metric, *,
+            seed=None, iterations=None, time_budget=None):
+        """
+        Args:
+            circuit: Circuit object, just may be used in calculate delta_depth.
+            candidates: sorted list of Candidate object.
+            metric: cycle or depth which used to calculate value of candidate.
+            seed: int / np.random.SeedSequence / None(fresh entropy).
+            iterations: iterations of each decision. default ITERATIONS
+            time_budget: seconds of the whole searching. default None(no limit)
+                => when the budget runs out, return the best plan found so far.
+        """
+        self.circuit = circuit
+        self.candidates = candidates
+        self.metric = metric
+
+        self.rng = np.random.default_rng(seed)
+        self.iterations = self.ITERATIONS if iterations is None else iterations
+        self.time_budget = time_budget
+
+        # positions / values of each candidates
+        self.positions = [ frozenset(candidate.pos) for candidate in candidates ]
+        self.values = [ candidate.delta(metric, circuit) for candidate in candidates ]
+
+    ##########################
+    #                        #
+    #       Tree States      #
+    #                        #
+    ##########################
+
+    def advance(self, cursor, used):
+        """ skip the candidates conflicting with used positions
+
+        Returns:
+            cursor: index of the first candidate could be selected.
+        """
+        while cursor < len(self.candidates) and not self.positions[cursor].isdisjoint(used):
+            cursor += 1
+
+        return cursor
+
+    def expansion(self, cursor, used):
+        """ gather the candidates conflicting with candidates[cursor]
+
+        just like SearchPlan.expansion, but ignore the ones conflicting with used.
+
+        Returns:
+            targets: list of index of candidates. may be empty.
+        """
+        if cursor == len(self.candidates):
+            return []
+
+        targets = [ cursor ]
+
+        for i in range(cursor + 1, len(self.candidates)):
+            if self.positions[i].isdisjoint(self.positions[cursor]):
+                break
+
+            if self.positions[i].isdisjoint(used):
+                targets.append(i)
+
+        return targets
+
+    def child(self, node, index):
+        """ get (create if not exists) the child of node by selecting candidates[index]
+
+        """
+        if index not in node.children:
+            node.children[index] = Node(self, node.cursor,
+                node.used | self.positions[index], parent=node, index=index)
+
+        return node.children[index]
+
+    ##########################
+    #                        #
+    #       MCTS Steps       #
+    #                        #
+    ##########################
+
+    def select(self, node):
+        """ select the child with max UCT value
+
+        rewards are normalized by the range of rewards seen so far.
+        """
+        scale = self.high - self.low if self.high > self.low else 1
+        log_visits = math.log(node.visits)
+
+        def uct(child):
+            exploitation = (child.mean - self.low) / scale
+            exploration = self.EXPLORATION * math.sqrt(log_visits / child.visits)
+
+            return exploitation + exploration
+
+        return max(node.children.values(), key=uct)
+
+    def rollout(self, node):
+        """ randomly complete the plan from node
+
+        sample target of each conflict group according to its value.
+
+        Returns:
+            selected: list of index of candidates selected in rollout.
+        """
+        selected = []
+        cursor, used = node.cursor, set(node.used)
+
+        while True:
+            cursor = self.advance(cursor, used)
+            targets = self.expansion(cursor, used)
+
+            if len(targets) == 0:
+                return selected
+
+            if len(targets) == 1:
+                target = targets[0]
+            else:
+                weights = np.clip([ self.values[i] for i in targets ], 0, None)
+                if weights.sum() <= 0:
+                    weights = np.ones(len(targets))
+
+                target = targets[ self.rng.choice(len(targets), p=weights / weights.sum()) ]
+
+            selected.append(target)
+            used |= self.positions[target]
+
+    def iterate(self):
+        """ one iteration of MCTS from self.root
+
+        """
+        node = self.root
+        path = [] # index of candidates selected in tree
+
+        # Step 1. selection
+        while not node.terminal and node.expanded:
+            node = self.select(node)
+            path.append(node.index)
+
+        # Step 2. expansion
+        if not node.terminal:
+            index = next(i for i in node.targets if i not in node.children)
+            node = self.child(node, index)
+            path.append(index)
+
+        # Step 3. simulation
+        selected = self.committed + path + self.rollout(node)
+        reward = sum(self.values[i] for i in selected)
+
+        self.low = min(self.low, reward)
+        self.high = max(self.high, reward)
+
+        if self._best is None or reward > self._best.saving:
+            self._best = Plan(self._plan(selected), reward)
+
+        # Step 4. backpropagation
+        while node is not None:
+            node.visits += 1
+            node.total += reward
+            node = node.parent
+
+    ##########################
+    #                        #
+    #       Searching        #
+    #                        #
+    ##########################
+
+    def _plan(self, selected):
+        # candidates of plan in the order of positions
+        return [ self.candidates[i] for i in sorted(selected) ]
+
+    @property
+    def best(self):
+        """ return the best plan found so far (Plan object or None)
+
+        """
+        return self._best
+
+    def reset(self):
+        """ reset searcher's states
+
+        """
+        self.root = Node(self, 0, frozenset())
+        self.committed = [] # index of candidates already decided
+
+        self._best = None
+        self.low, self.high = math.inf, -math.inf
+
+    def timeout(self, deadline):
+        return deadline is not None and time() >= deadline
+
+    def __call__(self):
+        """ Monte Carlo tree search
+
+        Returns:
+            Plans object contains the best plan.
+        """
+        self.reset()
+
+        deadline = None if self.time_budget is None else time() + self.time_budget
+
+        print('Monte Carlo tree search plan searching\n')
+        print('-' * 12 + '\n')
+
+        # at least one complete plan
+        self.iterate()
+
+        while not self.root.terminal and not self.timeout(deadline):
+            targets = self.root.targets
+
+            # Step 1. search from root (no need to search without conflict)
+            if len(targets) > 1:
+                for _ in range(self.iterations):
+                    if self.timeout(deadline):
+                        break
+
+                    self.iterate()
+
+            # Step 2. decide: select the most visited child
+            children = [ self.child(self.root, i) for i in targets ]
+            node = max(children, key=lambda child: (child.visits, child.mean))
+
+            if len(targets) > 1:
+                print(f'Expansion: Candidates size: {len(targets)}\n')
+                for child in children:
+                    print(f'{self.candidates[child.index]}  visits: {child.visits}, value: {child.mean:.2f}')
+                print(f'\nSelected: {self.candidates[node.index]}\n')
+                print('-' * 10 + '\n')
+
+            # Step 3. reuse the subtree of selected child
+            node.parent = None
+            self.root = node
+            self.committed.append(node.index)
+
+        if self.root.terminal:
+            # the decided plan is complete
+            saving = sum(self.values[i] for i in self.committed)
+            if saving > self._best.saving:
+                self._best = Plan(self._plan(self.committed), saving)
+        else:
+            print('Time budget runs out, using the best plan found so far.\n')
+
+        print(f'Complete Plan: \n\n{self.best}')
+
+        return Plans([ self.best ])
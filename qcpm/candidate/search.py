@@ -1,6 +1,9 @@
-import random
+from concurrent.futures import ThreadPoolExecutor
+from time import time
 
-from qcpm.candidate.simulation import Simulation
+import numpy as np
+
+from qcpm.candidate.simulation import BatchSimulation
 from qcpm.candidate.plan import Plan, Plans
 
 
@@ -54,11 +57,8 @@ def logger(searcher):
         s = f'\nSelected: {target}\n'
         s += '    ... '
 
-        end = searcher.pos + searcher.WINDOW_SIZE
-        if end > len(searcher.circuit):
-            end = len(searcher.circuit)
-        for i in range(searcher.pos, end):
-            s += searcher.circuit.draft[i]
+        window = searcher.circuit.view(searcher.pos, searcher.WINDOW_SIZE)
+        s += window.draft
         s += ' ... \n'
 
         logdata += s
@@ -67,7 +67,7 @@ def logger(searcher):
         # ----------
         # target:    ^ ^
         #
-        s = ' ' * (end - searcher.pos)
+        s = ' ' * len(window)
         s = list(s)
         try:
             for index in target.pos:
@@ -125,13 +125,29 @@ class SearchPlan:
 
     Remember: after selecting each candidate:
         => candidate.apply(circuit); circuit.update()
+
+    Random streams:
+        every conflicting target and every SIMULATION_CHUNK rollouts of it
+        get their own generator spawned from [seed], thus the same seed
+        gives the same plan however many workers are used.
+
+    Deadline:
+        with a [deadline], rollouts of each candidate are reduced to fit the
+        remaining time (estimated by the speed of previous simulations),
+        when time runs out targets are chosen by their own delta only.
+        (thus the plan also depends on the speed of machine.)
     
     """
     WINDOW_SIZE = 20
     SIMULATION_SIZE = 10
-    SIMULATION_TIMES = 10
-
-    def __init__(self, circuit, candidates, metric):
+    # rollouts of each candidate are simulated together by BatchSimulation
+    SIMULATION_TIMES = 1000
+    # rollouts simulated by one task (with one random stream)
+    SIMULATION_CHUNK = 250
+    # min rollouts of each candidate when simulating with deadline
+    SIMULATION_MIN_TIMES = 10
+
+    def __init__(self, circuit, candidates, metric, *, seed=None, workers=1, deadline=None):
         """
         Args:
             circuit: Circuit object.
@@ -142,11 +158,21 @@ class SearchPlan:
                 pos: eg. [1, 4]
                 pattern: eg. pattern.src/dst => {'operator': 'xx', 'operands': 'aa'}
             metric: cycle or depth which used to calculate value of candidate.
+            seed: int / np.random.SeedSequence / None(fresh entropy).
+            workers: size of thread pool used to simulate. default 1(no pool).
+            deadline: time.time() when searching should stop. default None(no limit)
         """
         self.circuit = circuit
         self.candidates = candidates
         self.metric = metric
 
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.seed = seed
+        self.workers = workers
+        self.deadline = deadline
+        self.pool = None # thread pool of simulation, created in __call__
+
         self.log = logger(self)
 
     def expansion(self):
@@ -185,6 +211,33 @@ class SearchPlan:
                 break
         
         return targets
+
+    def simulation_times(self, size):
+        """ rollouts of each candidate in next simulation.
+
+        Args:
+            size: number of candidates to simulate.
+        -------
+        Returns:
+            times: SIMULATION_TIMES without deadline,
+                0 => no time for simulation.
+        """
+        if self.deadline is None:
+            return self.SIMULATION_TIMES
+
+        remaining = self.deadline - time()
+        if remaining <= 0:
+            return 0
+
+        # the first simulation measures the speed of rollouts
+        if self.speed is None:
+            return self.SIMULATION_MIN_TIMES
+
+        # share remaining time with the rest conflicts (at most the rest candidates)
+        rest = sum(1 for candidate in self.candidates if candidate.begin >= self.pos)
+        times = int(remaining * self.speed / max(rest, 1) / size)
+
+        return max(self.SIMULATION_MIN_TIMES, min(times, self.SIMULATION_TIMES))
     
     def simulation(self, candidates):
         """ simulation to evaluate value of each candidate.
@@ -195,8 +248,45 @@ class SearchPlan:
         Returns:
             values: list of int value
         """
-        return [ Simulation(self)(candidate) + candidate.delta(self.metric, self.circuit) 
-                    for candidate in candidates ]
+        simulation_times = self.simulation_times(len(candidates))
+        if simulation_times == 0:
+            return [ candidate.delta(self.metric, self.circuit) for candidate in candidates ]
+
+        start = time()
+
+        # Step 1. split rollouts of each candidate into tasks
+        # eg. SIMULATION_TIMES = 1000, SIMULATION_CHUNK = 250 => 4 tasks each candidate
+        chunks = []
+        for begin in range(0, simulation_times, self.SIMULATION_CHUNK):
+            chunks.append( min(self.SIMULATION_CHUNK, simulation_times - begin) )
+
+        tasks = []
+        for candidate, seed in zip(candidates, self.seed.spawn(len(candidates))):
+            for times, chunk_seed in zip(chunks, seed.spawn(len(chunks))):
+                tasks.append( (candidate, times, chunk_seed) )
+
+        # Step 2. simulate each task (in the pool)
+        def simulate(task):
+            candidate, times, seed = task
+            simulation = BatchSimulation(self, np.random.default_rng(seed))
+
+            return simulation.rollouts(candidate, times)
+
+        if self.pool is None:
+            results = list(map(simulate, tasks))
+        else:
+            results = list(self.pool.map(simulate, tasks))
+
+        # Step 3. gather rollouts values of each candidate
+        values = []
+        for i, candidate in enumerate(candidates):
+            rollouts = np.concatenate(results[i * len(chunks): (i + 1) * len(chunks)])
+            values.append( rollouts.mean() + candidate.delta(self.metric, self.circuit) )
+
+        # rollouts per second
+        self.speed = simulation_times * len(candidates) / max(time() - start, 1e-6)
+
+        return values
     
     def reset(self):
         """ reset searcher's states
@@ -210,6 +300,15 @@ class SearchPlan:
         self.saving = 0 # total saving for selected plan
         self.selected = [] # should contains all selected candidates
 
+        # generator used to choose one of the targets with the same value
+        self.rng = np.random.default_rng(self.seed.spawn(1)[0])
+        self.speed = None # rollouts per second, measured in simulation
+
+        # delta values are memoized in candidates,
+        # calculate them ahead thus simulation tasks only read them.
+        for candidate in self.candidates:
+            candidate.delta(self.metric, self.circuit)
+
     def __call__(self):
         """ Monte Carlo-based plan searching
 
@@ -219,6 +318,26 @@ class SearchPlan:
         # Step 0. reset searcher's state
         self.reset()
 
+        self.pool = None
+        if self.workers > 1:
+            self.pool = ThreadPoolExecutor(max_workers=self.workers)
+
+        try:
+            self.search()
+        finally:
+            # shut down worker threads even if a rollout raises
+            if self.pool is not None:
+                self.pool.shutdown()
+
+        self.log('plan')(self.selected)
+        self.log('end')()
+
+        return Plans([ Plan(self.selected, self.saving) ])
+
+    def search(self):
+        """ searching loop of __call__: select candidates into self.selected
+
+        """
         self.log('start')()
         while len(self.candidates) != 0:
             # Step 1. select and expansion candidates
@@ -239,9 +358,8 @@ class SearchPlan:
                 # choose the target with max value
                 # ! values may be the same, should randomly choose one
                 max_value = max(values)
-                max_values = list(filter(lambda x:x == max_value, values))
-                max_index = random.randint(0, len(max_values) - 1)
-                target = targets[max_index]
+                max_indexes = [ i for i, value in enumerate(values) if value == max_value ]
+                target = targets[ max_indexes[self.rng.integers(len(max_indexes))] ]
             
             self.pos = target.begin
             
@@ -256,9 +374,4 @@ class SearchPlan:
 
             # Step 4. filter candidates that guarantee 
             # there is no conflict with target.
-            filter(lambda candidate: not (candidate & target), self.candidates)
-
-        self.log('plan')(self.selected)
-        self.log('end')()
-
-        return Plans([ Plan(self.selected, self.saving) ])
\ No newline at end of file
+            filter(lambda candidate: not (candidate & target), self.candidates)
\ No newline at end of file
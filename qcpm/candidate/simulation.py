@@ -119,3 +119,115 @@ class Simulation:
             values.append(value)
 
         return np.mean(values)
+
+
+class BatchSimulation(Simulation):
+    """ Batched Monte Carlo simulation
+
+    runs all the rollouts of one candidate together with numpy:
+        1. conflict matrix between the gathered targets.
+        2. masked weighted sampling for every rollout in each step.
+        3. cumulative value array of all rollouts.
+
+    each step of a rollout samples one target from the targets still
+    available in this rollout, thus a candidate needs at most len(targets)
+    vectorized steps no matter how many rollouts are simulated.
+    """
+    def __init__(self, searcher, rng=None):
+        super().__init__(searcher)
+
+        # numpy Generator used to sample targets.
+        self.rng = np.random.default_rng() if rng is None else rng
+
+    @staticmethod
+    def conflicts(candidate, targets):
+        """ build the conflict matrix of targets
+
+        Args:
+            candidate: the simulated Candidate object.
+            targets: list of Candidate object gathered by gatherCandidates.
+        -------
+        Returns:
+            matrix: (size, size) bool array, matrix[i, j] => targets[i] & targets[j]
+                remember matrix[i, i] is True, thus selected target is also removed.
+            free: (size, ) bool array, free[i] => targets[i] has no conflict with candidate
+        """
+        size = len(targets)
+        positions = [ set(target.pos) for target in targets ]
+
+        matrix = np.eye(size, dtype=bool)
+        for i in range(size):
+            for j in range(i + 1, size):
+                if not positions[i].isdisjoint(positions[j]):
+                    matrix[i, j] = matrix[j, i] = True
+
+        free = np.array([ position.isdisjoint(candidate.pos) for position in positions ], dtype=bool)
+
+        return matrix, free
+
+    def rollouts(self, candidate, times):
+        """ run [times] rollouts of candidate together
+
+        Args:
+            candidate: one Candidate object
+            times: rollouts size.
+        -------
+        Returns:
+            values: (times, ) float array, total value of each rollout.
+        """
+        metric, circuit = self.searcher.metric, self.searcher.circuit
+
+        values = np.full(times, candidate.delta(metric, circuit), dtype=float)
+        targets = self.gatherCandidates(candidate)
+
+        if len(targets) == 0:
+            return values
+
+        deltas = np.array([ target.delta(metric, circuit) for target in targets ], dtype=float)
+        # sampling weights: candidate with negative value would never be preferred.
+        weights = np.clip(deltas, 0, None)
+
+        matrix, free = self.conflicts(candidate, targets)
+        # available[r, i] => targets[i] still can be selected in r-th rollout
+        available = np.tile(free, (times, 1))
+        rollouts = np.arange(times)
+
+        while True:
+            active = available.any(axis=1)
+            if not active.any():
+                break
+
+            # Step 1. masked weights of each rollout
+            # if all available targets have no weight => choose uniformly
+            masked = np.where(available, weights, 0.0)
+            empty = active & (masked.sum(axis=1) <= 0)
+            masked[empty] = available[empty]
+
+            # Step 2. sample a target in each rollout
+            # eg. masked = [0, 2, 0, 3] => cumulative = [0, 2, 2, 5]
+            #   if p = 3.5 => 3 targets' cumulative <= p => select targets[3]
+            cumulative = np.cumsum(masked, axis=1)
+            p = self.rng.random(times) * cumulative[:, -1]
+            selected = np.minimum((cumulative <= p[:, None]).sum(axis=1), len(targets) - 1)
+
+            # Step 3. accumulate value and remove the conflicted targets
+            selected, rows = selected[active], rollouts[active]
+            values[rows] += deltas[selected]
+            available[rows] &= ~matrix[selected]
+
+        return values
+
+    def __call__(self, candidate, times=None):
+        """ simulate one candidate to get value
+
+        Args:
+            candidate: one Candidate object
+            times: rollouts size, default searcher.SIMULATION_TIMES
+        -------
+        Returns:
+            value: simulation result of this candidate.
+        """
+        if times is None:
+            times = self.searcher.SIMULATION_TIMES
+
+        return np.mean(self.rollouts(candidate, times))
@@ -1,4 +1,6 @@
 from qcpm.circuit.circuit import Circuit
 from qcpm.circuit.info import CircuitInfo
+from qcpm.circuit.transaction import Transaction
+from qcpm.circuit.view import CircuitView
 
-__all__ = ['Circuit', 'CircuitInfo']
\ No newline at end of file
+__all__ = ['Circuit', 'CircuitInfo', 'Transaction', 'CircuitView']
\ No newline at end of file
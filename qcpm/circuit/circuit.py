@@ -1,14 +1,22 @@
 import os
+from functools import partial
 
 from qcpm.circuit.info import CircuitInfo
+from qcpm.circuit.transaction import Transaction
+from qcpm.circuit.view import CircuitView
 from qcpm.preprocess import preprocess
 from qcpm.expander import Expander
-from qcpm.optimization import optimizer, reduction
+from qcpm.optimization import optimizer, reduction, fixpoint
 from qcpm.operator import Operator
 from qcpm.migration import migrate
 from qcpm.common import timerDecorator
 
 
+# max turns of optimization with window='qubit' and no [iteration] given
+# (the fixpoint optimizer bounds itself by REWRITE_BUDGET, passes don't)
+OPTIMIZE_LIMIT = 20
+
+
 class Circuit:
     """ Circuit object creating by QASM file.
 
@@ -36,6 +44,9 @@ class Circuit:
         ## circuit info of origin circuit, setted during _load_circuit
         self.origin = None
 
+        # opened Transaction objects (nested), see transaction()
+        self._transactions = []
+
         self._load_circuit(path, optimize)
 
     def _load_circuit(self, path, optimize):
@@ -152,30 +163,45 @@ class Circuit:
 
         return changed, temp_operators
     
-    def optimize(self, operators=None, *, iteration=3):
+    def optimize(self, operators=None, *, iteration=None, window='global'):
         """ Optimize the loaded circuit by each Operator until no change occurs
 
-        using _optimize() while no change occurs.
+        default using the worklist optimizer [fixpoint] (in ./optimization)
+        which re-examines only the changed positions until no change occurs.
+
+        with [iteration] / window='qubit': using _optimize() while no change occurs.
         will keep the optimized operators in [self.operators]
         and also keep the [self.draft] through subroutine: _optimize()
 
         Args:
             operators: iteratable Operators object.
                 => if operators is None, optimize circuit(self) itself.
-            iteration: iteration turns that optimization. default=3
+            iteration: iteration turns that optimization. 
+                default None => no turns limit(using fixpoint optimizer),
+                    with window='qubit' => at most OPTIMIZE_LIMIT turns.
+            window: 'global' / 'qubit' window of reduction and commutation.
+                => 'qubit' matches on the last operators of each wire.
         """
         if operators == None:
             operators = self
 
+        if iteration is None and window == 'global':
+            _, operators = self._optimize(operators, optimizer=fixpoint)
+            iteration = 0
+        elif iteration is None:
+            iteration = OPTIMIZE_LIMIT
+        
         count = 0
         while count < iteration:
             # optimize: reduction -> commutation
-            changed, operators = self._optimize(operators)
+            changed, operators = self._optimize(operators, 
+                optimizer=partial(optimizer, window=window))
 
             if not changed:
                 # after reduction -> commutation -> ... -> reduction -> commutation
                 # at last: apply reduction.
-                _, operators = self._optimize(operators, optimizer=reduction)
+                _, operators = self._optimize(operators, 
+                    optimizer=partial(reduction, window=window))
                 break
             
             count += 1
@@ -183,6 +209,39 @@ class Circuit:
         self.operators = operators
         self._info = None # reset circuitInfo
 
+    def change(self, index, new_type, new_operands=None, new_angle=None):
+        """ change circuit[index] by Operator.change
+
+        recorded by current transaction (if exists) thus could be rolled back.
+
+        Args:
+            index: position of operator in circuit.
+            [! Other args should be corresponding to Operator.change]
+        """
+        if len(self._transactions) != 0:
+            self._transactions[-1].record(index)
+
+        self._info = None # reset circuitInfo
+
+        return self.operators[index].change(new_type, new_operands, new_angle)
+
+    def transaction(self):
+        """ open a transaction to try changes and roll back them
+
+        Returns:
+            Transaction object (context manager)
+                => leaving without commit() will roll back all changes.
+        """
+        return Transaction(self)
+
+    def view(self, offset=0, length=None):
+        """ view of circuit[offset: offset + length] without copying operators
+
+        Returns:
+            CircuitView object.
+        """
+        return CircuitView(self, offset, length)
+
     def update(self):
         """ using self.operators re-calculate self.draft
 
@@ -244,13 +303,17 @@ class Circuit:
     #                    #
     ######################
 
+    # abandoned operators (may exist in a transaction) are ignored
+
     @property
     def cycle(self):
-        return sum(map(Operator.count_qubits, [op.type for op in self.operators]))
+        return sum(map(Operator.count_qubits, 
+            [op.type for op in self.operators if op.type != Operator.ABANDON]))
 
     @property
     def depth(self):
-        return CircuitInfo.compute_depth(self)
+        return CircuitInfo.compute_depth(
+            [op for op in self.operators if op.type != Operator.ABANDON])
 
     @property
     def info(self):
@@ -0,0 +1,69 @@
+class Transaction:
+    """ undo log of changes on a Circuit.
+
+    created by circuit.transaction(), every circuit.change(index, ...) in it
+    is recorded and will be rolled back when leaving, unless committed.
+
+    Example:
+        with circuit.transaction() as transaction:
+            candidate.apply(circuit, silence=True)
+            depth = circuit.depth # abandoned operators are ignored
+
+            if depth < best:
+                transaction.commit()
+        # => not committed: circuit is recovered
+
+    [! Caution]: do not call circuit.update() / optimize() in a transaction,
+        which will change the positions of operators.
+    """
+    def __init__(self, circuit):
+        self.circuit = circuit
+        self.log = [] # (index, type, operands, angle) before each change
+        self.committed = False
+
+    def record(self, index):
+        """ record the state of circuit[index] before changing it
+
+        """
+        operator = self.circuit[index]
+        self.log.append( (index, operator.type, operator.operands, operator.angle) )
+
+    def commit(self):
+        """ keep the changes when leaving the transaction
+
+        """
+        self.committed = True
+
+    def rollback(self):
+        """ recover the changed operators in a reversed order
+
+        """
+        for index, op_type, operands, angle in reversed(self.log):
+            operator = self.circuit[index]
+            operator.type, operator.operands, operator.angle = op_type, operands, angle
+
+        self.log = []
+        self.circuit._info = None # reset circuitInfo
+
+    ##########################
+    #                        #
+    #     Dunder Methods     #
+    #                        #
+    ##########################
+
+    def __enter__(self):
+        self.circuit._transactions.append(self)
+
+        return self
+
+    def __exit__(self, exec_type, exec_value, traceback):
+        self.circuit._transactions.pop()
+
+        if exec_type is not None or not self.committed:
+            self.rollback()
+        elif len(self.circuit._transactions) != 0:
+            # nested transaction => outer one may still roll back these changes
+            self.circuit._transactions[-1].log.extend(self.log)
+
+    def __len__(self):
+        return len(self.log)
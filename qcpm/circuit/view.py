@@ -0,0 +1,99 @@
+from qcpm.circuit.info import CircuitInfo
+from qcpm.operator import Operator
+
+
+class CircuitView:
+    """ view of a continuous part of Circuit without copying operators.
+
+    view[i] <=> circuit[offset + i], and len(view) == length
+
+    Example:
+        circuit: x-cx-h-x-cx-cx ... => draft: xchxcc...
+        view = CircuitView(circuit, 2, 3) (or circuit.view(2, 3))
+            => view.draft: hxc, view[0]: h, view[1:]: CircuitView of x-cx
+
+    changes of circuit(operators) are visible in view, while its range is fixed
+    (may be out of date after circuit.update() / optimize()).
+    """
+    def __init__(self, circuit, offset=0, length=None):
+        """
+        Args:
+            circuit: Circuit object (or CircuitView).
+            offset: beginning position in circuit. default 0
+            length: size of view. default None => to the end of circuit.
+                => offset / length are clipped to the range of circuit.
+        """
+        if isinstance(circuit, CircuitView):
+            # view of view => view of the same circuit
+            view = circuit
+            circuit, begin, size = view.circuit, view.offset, len(view)
+        else:
+            begin, size = 0, len(circuit)
+
+        offset = min(max(offset, 0), size)
+        rest = size - offset
+
+        self.circuit = circuit
+        self.offset = begin + offset
+        self.length = rest if length is None else min(max(length, 0), rest)
+
+    ######################
+    #                    #
+    #     Properties     #
+    #                    #
+    ######################
+
+    @property
+    def system(self):
+        return self.circuit.system
+
+    @property
+    def draft(self):
+        return self.circuit.draft[self.offset: self.offset + self.length]
+
+    # abandoned operators (may exist in a transaction) are ignored, like in Circuit
+
+    @property
+    def cycle(self):
+        return sum(Operator.count_qubits(op.type) for op in self if op.type != Operator.ABANDON)
+
+    @property
+    def depth(self):
+        return CircuitInfo.compute_depth(
+            [op for op in self if op.type != Operator.ABANDON])
+
+    ##########################
+    #                        #
+    #     Dunder Methods     #
+    #                        #
+    ##########################
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        # view[a:b] => CircuitView (without copy)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                raise ValueError(f'Unsupported step: <{step}> for CircuitView')
+
+            return CircuitView(self.circuit, self.offset + start, max(stop - start, 0))
+        
+        # view[i] => Operator
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError(f'CircuitView index out of range: <{index}>')
+
+        return self.circuit.operators[self.offset + index]
+
+    def __iter__(self):
+        operators = self.circuit.operators
+
+        for i in range(self.offset, self.offset + self.length):
+            yield operators[i]
+
+    def __repr__(self):
+        # like Circuit: cx-h-cx-sdg-...
+        return '-'.join(map(lambda op: op.type, self))
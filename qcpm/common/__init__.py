@@ -1,4 +1,5 @@
 from qcpm.common.decorator import countDecorator, timerDecorator
 from qcpm.common.timer import Timer
+from qcpm.common.rules import loadRules, hashRules
 
-__all__ = ['countDecorator', 'timerDecorator', 'Timer']
\ No newline at end of file
+__all__ = ['countDecorator', 'timerDecorator', 'Timer', 'loadRules', 'hashRules']
\ No newline at end of file
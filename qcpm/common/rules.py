@@ -0,0 +1,101 @@
+import os
+import pkgutil
+import json
+import hashlib
+
+
+# folder of derived rule files (see loadRules), QCPM_CACHE='' => not cached on disk
+CACHE_DIR = os.environ.get('QCPM_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'qcpm'))
+
+def loadRules(package, system, name):
+    """ load rules of [system] from [package]/rules/[system]/[name].json
+
+    if the rule file of [system] doesn't exist, rules are derived on demand
+    from the IBM rule file by qcpm.migration.convert, and cached on disk:
+        [CACHE_DIR]/[package]/[system]/[name]-[hash].json
+    hash is taken over CONVERT_VERSION, the IBM rules and the IBM => [system] migration rules,
+    thus the cached file is derived again once any of them changed.
+    the cache is skipped when CACHE_DIR is '' or not writable.
+
+    rules not belonging to a system (system=None) are loaded from
+    [package]/rules/[name].json, eg. migration rules 'IBM_to_Surface',
+    and are never derived (FileNotFoundError if missing).
+
+    Args:
+        package: eg. 'qcpm.optimization'
+        system: eg. 'Surface', None => not in a system's folder
+        name: eg. 'hadamard'
+    -------
+    Returns:
+        rules: list of rules, eg. [ { "src": [...], "dst": [...] }, ... ]
+    """
+    path = f'/rules/{name}.json' if system is None else f'/rules/{system}/{name}.json'
+    try:
+        data = pkgutil.get_data(package, path)
+        return json.loads(data.decode())
+    except FileNotFoundError:
+        if system is None or system == 'IBM':
+            raise
+
+    # avoid circular import: migration => optimization => common
+    from qcpm.migration import convert, getMigrater
+    from qcpm.migration.convert import CONVERT_VERSION
+
+    source_rules = loadRules(package, 'IBM', name)
+    migration_rules = getMigrater('IBM', system).rules
+
+    if CACHE_DIR == '':
+        return list(convert(source_rules, system))
+
+    digest = hashlib.sha1( json.dumps([CONVERT_VERSION, source_rules, migration_rules]).encode() ).hexdigest()[:12]
+    path = os.path.join(CACHE_DIR, package, system, f'{name}-{digest}.json')
+
+    if os.path.exists(path):
+        with open(path, 'r') as file:
+            return json.load(file)
+
+    rules = list(convert(source_rules, system))
+
+    # write to temp file, then replace => cached file is never half written
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        temp = f'{path}.{os.getpid()}.tmp'
+        with open(temp, 'w') as file:
+            json.dump(rules, file)
+
+        os.replace(temp, path)
+    except OSError:
+        # not writable => derived again next time
+        pass
+
+    return rules
+
+_rules_hash = None # hash of all packaged rule files, set by hashRules(when first call)
+
+def hashRules():
+    """ hash of all rule files in package qcpm: [qcpm]/**/rules/**/*.json
+
+    Returns:
+        hash: str of hex digest
+    """
+    global _rules_hash
+
+    if _rules_hash is None:
+        root = os.path.dirname(os.path.dirname(__file__))
+        digest = hashlib.sha1()
+
+        for folder, _, files in sorted(os.walk(root)):
+            if 'rules' not in os.path.relpath(folder, root).split(os.sep):
+                continue
+
+            for file in sorted(files):
+                if file.endswith('.json'):
+                    path = os.path.join(folder, file)
+                    digest.update(os.path.relpath(path, root).encode())
+                    with open(path, 'rb') as data:
+                        digest.update(data.read())
+
+        _rules_hash = digest.hexdigest()
+
+    return _rules_hash
@@ -5,8 +5,27 @@ class QCPMConfig:
         self.strategy = kwargs.get('strategy', None)
         self.metric = kwargs.get('metric', 'cycle')
 
+        # Monte Carlo simulation (MCM)
+        self.seed = kwargs.get('seed', None)
+        self.simulation_workers = kwargs.get('simulation_workers', 1)
+        # Monte Carlo tree search (MCTS)
+        self.iterations = kwargs.get('iterations', None)
+        self.search_time = kwargs.get('search_time', None)
+        # beam search (beam)
+        self.beam_width = kwargs.get('beam_width', 8)
+
+        # time budget (seconds), default None(no limit)
+        ## time_budget: each file, batch_budget: all files in a dir
+        self.time_budget = kwargs.get('time_budget', None)
+        self.batch_budget = kwargs.get('batch_budget', None)
+
         self.depth_size = kwargs.get('depth_size', 'all') # small/medium/large
         self.system = kwargs.get('system', 'IBM')
 
         self.stat_path = kwargs.get('stat', None)
+        # processes used in batch work (dir to dir)
+        ## default 1 => in current process, None => os.cpu_count()
+        self.workers = kwargs.get('workers', 1)
+        # skip files done in last batch work (see qcpm.statistics.Manifest)
+        self.resume = kwargs.get('resume', False)
         
\ No newline at end of file
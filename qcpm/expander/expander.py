@@ -1,98 +1,93 @@
-import json
-import pkgutil
-from itertools import zip_longest
-from copy import deepcopy
-
 from qcpm.operator import Operator
-from qcpm.pattern.pattern import Pattern
+from qcpm.common.rules import loadRules
+
+
+_templates = {
+    # should be set by getTemplates(when first call)
+    # For example:
+    # 'IBM': { 'swap': [ ('cx', [0, 1]), ('cx', [1, 0]), ('cx', [0, 1]) ], ... }
+}
+
+def getTemplates(system):
+    """ expansion templates of system, indexed by gate type
+
+    pattern:
+    {
+        "src": [ ["ccz", [0, 1, 2]] ],
+        "dst": [ ["t", [0]], ..., ["cx", [2, 0]], ... ]
+    }
+    => template of 'ccz': [ ('t', [0]), ..., ('cx', [2, 0]), ... ]
+        where operands are positions in operands of the src operator,
+        and angles are kept in types, eg. ('ry(-pi/2)', [1])
+
+    Args:
+        system: eg. 'IBM'
+    -------
+    Returns:
+        templates: dict gate type => template
+    """
+    if system not in _templates:
+        templates = {}
 
+        for pattern in loadRules('qcpm.expander', system, 'expansion'):
+            (op_type, operands), = pattern['src']
 
-class Expander:
-    """ Expander that expand single op to concreate operators, like: swap => cx cx cx
+            template = []
+            for operation in pattern['dst']:
+                op_to = operation[0]
+                if len(operation) == 3:
+                    angle = operation[2]
+                    angle = ','.join(angle) if isinstance(angle, list) else angle
+                    op_to = f'{op_to}({angle})'
 
-    """
-    def __init__(self, system='IBM'):
-        self.patterns = {} # contains Pattern object.
-        self._init_patterns()
-
-        self.system = system
+                template.append( (op_to, [ operands.index(opd) for opd in operation[1] ]) )
 
-    def _init_patterns(self):
-        """ load pattern file and initiate
+            # the first pattern of a gate type is used (as Expander.check did)
+            templates.setdefault(op_type, template)
 
-        load pattern json file and init self.patterns
-        will load all system's pattern info in advance.
+        _templates[system] = templates
 
-        """
-        systems = ['IBM', 'Surface', 'U']
-        self.patterns = {} # reset to empty
+    return _templates[system]
 
-        for system in systems:
-            data = pkgutil.get_data(__package__, f'/rules/{system}/expansion.json')
-            patterns_data = json.loads(data.decode())
 
-            self.patterns[system] = []
+class Expander:
+    """ Expander that expand single op to concreate operators, like: swap => cx cx cx
 
-            # pattern: 
-            # {
-            #     "src": [ ["swap", [0, 1]] ],
-            #     "dst": [ ["cx", [0, 1]],["cx", [1, 0]],["cx", [0, 1]] ]
-            # }
-            for pattern in patterns_data:
-                # Pattern(src, dst)
-                self.patterns[system].append( Pattern(**pattern) )
+    """
+    def __init__(self, system='IBM'):
+        self.system = system
+        self.templates = getTemplates(system) # gate type => template
 
     def check(self, operator):
         """ Check whether a operator need to expand
 
         Returns:
             ok: True if this operator do need to expand.
-            pattern: a expansion pattern corresponding to this operator, or None
+            template: a expansion template corresponding to this operator, or None
         """
+        template = self.templates.get(operator.type)
 
-        for pattern in self.patterns[self.system]:
-            # pattern.data['src']: [ ["swap", [0, 1]] ]
-            #   => [0][0]: 'swap'
-            if operator.type == pattern.data['src'][0][0]:
-                return True, pattern
-            
-        return False, None 
+        return template is not None, template
 
-    def expand(self, operator, pattern):
-        """ expand operator according to expansion pattern
+    def expand(self, operator, template):
+        """ expand operator according to expansion template
 
         will generate operators
 
         """
-        _, books = pattern.match([operator], [0], return_='books')
-
-        _, ops_to = pattern.opr
-        operands_to = pattern.dst['operands']
-        angles_to = pattern.angles[1]
-
-        cur = 0
-        for (op_to, angle_to) in zip_longest(ops_to, angles_to):
-            # eg. h => 1, c => 2 ...
-            size = Operator.count_qubits(op_to)
-            # eg. 'ab' => [1, 4]
-            operands = [ books[operand] for 
-                operand in operands_to[cur: cur + size] ]
-            
-            new_operator = deepcopy(operator)
-            new_operator.change(
-                op_to, # new operator
-                operands,
-                angle_to
-            )
-            yield new_operator
-
-            cur += size
+        operands = operator.operands
+
+        for (op_to, positions) in template:
+            # eg. operator: swap q[3],q[5]; ('cx', [1, 0]) => cx q[5],q[3];
+            yield Operator(op_to, [ operands[position] for position in positions ])
 
     def __call__(self, operators):
+        templates = self.templates
+
         for operator in operators:
-            ok, pattern = self.check(operator)
-            
-            if ok:
-                yield from self.expand(operator, pattern)
+            template = templates.get(operator.type)
+
+            if template is not None:
+                yield from self.expand(operator, template)
             else:
-                yield operator
\ No newline at end of file
+                yield operator
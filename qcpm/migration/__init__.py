@@ -1,4 +1,6 @@
-from qcpm.migration.migrate import migrate
+from qcpm.migration.migrate import migrate, migrate_many, getMigrater
 from qcpm.migration.convert import convert
+from qcpm.migration.stream import migrate_file, migrate_dir
+from qcpm.migration.planner import plan
 
-__all__ = ['migrate', 'convert']
\ No newline at end of file
+__all__ = ['migrate', 'migrate_many', 'getMigrater', 'convert', 'migrate_file', 'migrate_dir', 'plan']
\ No newline at end of file
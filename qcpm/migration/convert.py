@@ -1,11 +1,19 @@
 import copy
+from itertools import product
 
-from qcpm.migration.migrate import Migrater
+from qcpm.migration.migrate import getMigrater
 
 
-def convert(source_patterns, target_system):
+# version of convert(), salted into the hash of derived rule files (see loadRules)
+## bump it once convert() generates different patterns from the same rules.
+CONVERT_VERSION = 1
+
+def convert(source_patterns, target_system, *, alternatives=False, limit=None):
     """ convert patterns into target_system's form
 
+    works as a generator: converted patterns are generated lazily,
+    duplicated patterns (the same under qubit relabelling) are generated once.
+
     Args:
         source_patterns: IBM form patterns. 
             eg. 
@@ -17,8 +25,11 @@ def convert(source_patterns, target_system):
                 ...
             ]
         target_system: for example: 'Surface'
+        alternatives: False => each gate of src is converted by its first migration rule.
+            True => by all its migration rules, eg. h = ry z = z ry = x ry in Surface.
+        limit: max number of converted patterns of each source pattern. None => no limit.
     -------
-    Returns:
+    Generates:
         converted patterns:
             eg. 
             Recall that in Surface: z = xy
@@ -30,40 +41,49 @@ def convert(source_patterns, target_system):
                 ...
             ]
     """
-    migration_rules = Migrater('IBM', target_system).rules
-    converted_patterns = []
+    migration_rules = getMigrater('IBM', target_system).rules
+    seen = set() # canonical forms of generated patterns
 
     for pattern in source_patterns:
         # eg.
         # { "src": [ ["z", [0]], ["z", [0]] ], "dst": [] }
-        for converted_pattern in _convert(pattern, migration_rules):
-            converted_patterns.append(converted_pattern)
-    
-    return converted_patterns
+        count = 0
+        for converted_pattern in _convert(pattern, migration_rules, alternatives):
+            if limit is not None and count >= limit:
+                break
 
-def _convert(source_patten, rules):
+            key = _canonical(converted_pattern)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            yield converted_pattern
+            count += 1
+
+def _convert(source_patten, rules, alternatives=False):
     """ subroutine used in convert()
 
     convert one sinlge pattern by rules.
-    may convert to several patterns.
+    may convert to several patterns (generated lazily).
 
     Args:
         source_pattern: eg. { "src": [ ["z", [0]], ["z", [0]] ], "dst": [] }
         rules: migration rules from Migrater()
             eg. [ ... { "src": [ ["z", [0]], "dst": [ ["x", [0]], ["y", [0]] ] } .. ]
+        alternatives: use all matched rules of each src operator or just the first one.
     -------
-    Returns:
-        converted_patterns from this source_pattern. A List.
+    Generates:
+        converted_patterns from this source_pattern.
     """
-    def solve(target):
+    def solve(target, alternatives):
         """
         target may be 'src'/ 'dst',
         eg. "src" =>  [
             ["h", [0]], ["s", [0]], ["h", [0]]
         ] # => call this is a [pattern], while call ["h", [0]] is a [operator]
 
-        will reutrn the list of possible solved patterns:
-        one of the patterns like:
+        will reutrn the choices of each operator, the product of them
+        are possible solved patterns, one of the patterns like:
         [
             ['ry', [0], '-pi/2'], ['z', [0]], 
             ['ry', [0], 'pi/2'], ['rx', [0], 'pi/2'], ['ry', [0], '-pi/2'], 
@@ -72,15 +92,15 @@ def _convert(source_patten, rules):
 
         cause of the gate may migrate to different compositions of gates like H:
         h = ry z = z ry = x ry
-        returns are list of patterns corresponding to all possibility
         
         Args: 
             target: 'src' / 'dst'
+            alternatives: keep all matched rules of each operator.
         -------
         Returns:
-            list of patterns
+            list of choices(list of operators' list) of each operator
         """
-        solved_patterns = [[]]
+        choices = []
 
         # eg. target = 'src
         # source_pattern[target] = [ ["h", [0]], ["s", [0]], ["h", [0]] ]
@@ -93,40 +113,17 @@ def _convert(source_patten, rules):
                 ok, pattern = _match(operator, rule)
                 if ok:
                     matched_operators.append(pattern)
-                    break
+                    if not alternatives:
+                        break
             
             # matched_operators is the list of operators
             #   => thus each elem in matched_operators is list of operator
             if len(matched_operators) == 0:
                 matched_operators.append([operator])
-            elif target == 'dst':
-                matched_operators = matched_operators[:1]
-
-            # find matched operators
-            # Roughly explaination: 
-            # 
-            # for h = ry z = z ry = x ry, thus matched size: 3
-            # if solved_patterns = [ pat1, pat2 ], after appending h operator:
-            # should be: [ pat1+[ry z], pat1+[z ry], pat1+[x ry], pat2+[ry z] ... ]
-            # 
-            temp_patterns = []
-            for i in range(len(solved_patterns)):
-                for operators in matched_operators:
-                    # if solved_patterns = [ pat1, pat2 ]
-                    # copy the pat1 cause pat1 may have different possible successors
-                    pattern = solved_patterns[i].copy()
-                    # do pat1+[ry z] menthioned above
-                    pattern.extend(operators)
-
-                    temp_patterns.append(pattern)
-            
-            solved_patterns = temp_patterns
 
-        return solved_patterns
+            choices.append(matched_operators)
 
-    converted_patterns = []
-    converted_src = solve('src')   
-    converted_dst = solve('dst')
+        return choices
 
     # for example:
     # 
@@ -136,17 +133,47 @@ def _convert(source_patten, rules):
     # then total possibility: 
     # 3 * 1 * 3 = 9 for [hsh] - src
     # and 1 * 3 * 1 = 3 for [ShS] - dst
-    # Total: src * dst => 9 * 3 = 27 
+    # 
+    # alternatives of dst are dominated by the shortest one
+    # (the same src, but more gates after mapping), thus only
+    # 9 * 1 patterns are generated one by one (by product).
+
+    dst = []
+    for operators in solve('dst', alternatives):
+        dst.extend( min(operators, key=len) )
+
+    for choice in product(*solve('src', alternatives)):
+        src = [ operator for operators in choice for operator in operators ]
+        if src == dst:
+            # trivial pattern: src => src
+            continue
+
+        yield {
+            'src': src,
+            'dst': dst
+        }
 
-    for src in converted_src:
-        for dst in converted_dst:
-            # Total possibility size: src * dst
-            converted_patterns.append({
-                'src': src,
-                'dst': dst
-            })
+def _canonical(pattern):
+    """ canonical form of pattern: qubits relabelled in order of first appearance
 
-    return converted_patterns
+    eg. { "src": [ ["cx", [1, 0]] ], "dst": [] } 
+        and { "src": [ ["cx", [0, 1]] ], "dst": [] } => the same form
+
+    Returns:
+        hashable canonical form.
+    """
+    labels = {}
+    form = []
+    for target in ('src', 'dst'):
+        for operator in pattern[target]:
+            operands = tuple( labels.setdefault(opd, len(labels)) for opd in operator[1] )
+            angle = operator[2] if len(operator) == 3 else ''
+            angle = tuple(angle) if isinstance(angle, list) else angle
+
+            form.append( (operator[0], operands, angle) )
+        form.append(None) # separate src and dst
+
+    return tuple(form)
 
 
 def _match(operator, rule):
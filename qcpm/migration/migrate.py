@@ -1,8 +1,14 @@
-import pkgutil
-import json
-from collections import deque
-
+from qcpm.common.rules import loadRules
 from qcpm.migration.pattern import MigrationPattern 
+from qcpm.migration.planner import plan
+from qcpm.optimization.dispatch import GateBuffer, SuffixTrie
+
+
+_migraters = {
+    # should be set by getMigrater(when first call)
+    # For example:
+    # ('IBM', 'Surface'): Migrater('IBM', 'Surface')
+}
 
 
 class Migrater:
@@ -11,18 +17,38 @@ class Migrater:
     Migrater works just like Invoker(Reducer/..) in qcpm.optimization 
 
     """
-    def __init__(self, source_type, target_type):
+    def __init__(self, source_type, target_type, rules=None):
+        """
+        Args:
+            source_type: eg. 'IBM'
+            target_type: eg. 'Surface'
+            rules: rules(src => dst) to use. default None => load from rule files.
+        """
         # patterns data => self.rules
+        if rules is None:
+            rules = self._load_rules(source_type, target_type)
+        self.rules = rules
+
+        self.patterns = [ MigrationPattern(**rule) for rule in self.rules ]
+        # index patterns by their gate codes (src operator)
+        self.trie = SuffixTrie([ pattern.src['operator'] for pattern in self.patterns ])
+
+        # the max/min size of operator need to match in all patterns
+        self.min_size = len(min(self.rules, key=lambda rule:len(rule['src']))['src'])
+        self.max_size = len(max(self.rules, key=lambda rule:len(rule['src']))['src'])
+
+    def _load_rules(self, source_type, target_type):
         # 1. when [source_type]_to_[target_type] doesn't esist.
         # 2. if we have 'IBM_to_Surface.json', we can also load 'Surface_to_IBM'
         #       by just swapping the src/dst in loaded self.rules
+        # 3. neither exists => compose rules along the shortest path
+        #       (see qcpm.migration.planner), eg. U => IBM => Surface
         # 
         # print(f'Try to migration from {source_type} to {target_type}')
 
         swap = False
         try:
-            path = f'/rules/{source_type}_to_{target_type}.json'
-            data = pkgutil.get_data(__package__, path)
+            rules = loadRules(__package__, None, f'{source_type}_to_{target_type}')
         except FileNotFoundError:
             # For example: if we just give 'IBM_to_Surface.json'
             # when try to load 'Surface_to_IBM.json', [FileNotFoundError] occur!
@@ -31,20 +57,16 @@ class Migrater:
             # and then swap loaded data's src/dst.
             # 
             swap = True
-            path = f'/rules/{target_type}_to_{source_type}.json'
-            data = pkgutil.get_data(__package__, path)
+            try:
+                rules = loadRules(__package__, None, f'{target_type}_to_{source_type}')
+            except FileNotFoundError:
+                return plan(source_type, target_type)
 
-        self.rules = json.loads(data.decode())
         if swap:
-            self.rules = [ {'src': rule['dst'], 'dst': rule['src']} 
-                for rule in self.rules]
-
-        self.patterns = [ MigrationPattern(**rule) for rule in self.rules ]
-        
+            rules = [ {'src': rule['dst'], 'dst': rule['src']} 
+                for rule in rules]
 
-        # the max/min size of operator need to match in all patterns
-        self.min_size = len(min(self.rules, key=lambda rule:len(rule['src']))['src'])
-        self.max_size = len(max(self.rules, key=lambda rule:len(rule['src']))['src'])
+        return rules
 
     def __call__(self, ops):
         """
@@ -52,17 +74,58 @@ class Migrater:
         but Migrater will not change the input ops and
         just generate operators(migration version)
 
+        if ops keeps gate codes (GateBuffer), only the patterns whose
+        gate codes match the end of ops are tried (through self.trie).
+
         Args:
             ops: List of Operator, also may Circuit object
         """
         if len(ops) < self.min_size:
             return []
 
-        for pattern in self.patterns:
-            # not like ReductionPattern, 
-            # MigrationPattern.map will return list of Operators 
-            yield from pattern.map(ops)
+        codes = getattr(ops, 'codes', None)
+        if codes is None:
+            for pattern in self.patterns:
+                # not like ReductionPattern, 
+                # MigrationPattern.map will return list of Operators 
+                yield from pattern.map(ops)
 
+            return
+
+        # only try the patterns whose gate codes match the end of ops,
+        # if patterns[i] changes ops => re-match ops for patterns after i.
+        matched = self.trie.match(codes)
+        i = 0
+        while i < len(matched):
+            index = matched[i]
+            size = len(ops)
+
+            yield from self.patterns[index].map(ops)
+
+            if len(ops) != size:
+                matched = [ j for j in self.trie.match(codes) if j > index ]
+                i = 0
+            else:
+                i += 1
+
+
+def getMigrater(source_type, target_type):
+    """ getMigrater according to source and target system
+
+    init Migrater when first call it.
+    else return the memoized migrater by (source_type, target_type)
+
+    Args:
+        source_type: eg. 'IBM'
+        target_type: eg. 'Surface'
+    -------
+    Returns:
+        migrater: Migrater object
+    """
+    if (source_type, target_type) not in _migraters:
+        _migraters[(source_type, target_type)] = Migrater(source_type, target_type)
+
+    return _migraters[(source_type, target_type)]
 
 def migrate(operators, source_type, target_type):
     """ QASM code migrate: from [source_type] to [target_type]
@@ -75,8 +138,8 @@ def migrate(operators, source_type, target_type):
         target_type: eg. 'Surface'
     
     """    
-    buffer = deque()
-    migrater = Migrater(source_type, target_type)
+    buffer = GateBuffer() # deque keeping gate codes
+    migrater = getMigrater(source_type, target_type)
 
     for operator in operators:
         buffer.append(operator)
@@ -96,4 +159,20 @@ def migrate(operators, source_type, target_type):
 
     # yield the left operators
     while len(buffer) != 0:
-        yield buffer.popleft()
\ No newline at end of file
+        yield buffer.popleft()
+
+
+def migrate_many(circuits, source_type, target_type):
+    """ migrate a batch of circuits from [source_type] to [target_type]
+
+    all circuits share the memoized Migrater (see getMigrater).
+
+    Args:
+        circuits: list of (list of Operator / Circuit object).
+        source_type: eg. 'IBM'
+        target_type: eg. 'Surface'
+    -------
+    Returns:
+        list of migrated operators(list of Operator) of each circuit.
+    """
+    return [ list(migrate(operators, source_type, target_type)) for operators in circuits ]
@@ -22,6 +22,17 @@ class MigrationPattern(ReductionPattern):
         # Step 1. test operator matching
         if not self._matchTypes(ops):
             return []
+
+        # compiled: match and build by generated functions
+        if self.COMPILED:
+            values = self.compiled.match(ops, range( len(ops) - self.size, len(ops) ))
+            if values is None:
+                return []
+
+            for i in range(self.size):
+                ops.pop()
+
+            return self.compiled.build(values)
         
         # Step 2. test operands matching
         # ------------------------------
@@ -0,0 +1,159 @@
+import os
+from collections import deque
+from importlib.resources import files
+
+from qcpm.operator import Operator
+
+
+_tables = {
+    # composed rule tables, set by plan(when first call)
+    # For example:
+    # ('U', 'Surface'): [ { "src": [...], "dst": [...] }, ... ]
+}
+
+##########################
+#                        #
+#     Tool Functions     #
+#                        #
+##########################
+
+def edges():
+    """ migrations could be done directly by rule files
+
+    'IBM_to_Surface.json' => IBM <=> Surface (swapped rules for the reverse)
+    rule files are listed through the package loader (like loadRules)
+
+    Returns:
+        graph: dict system => set of systems
+    """
+    graph = {}
+
+    for file in files(__package__).joinpath('rules').iterdir():
+        name, ext = os.path.splitext(file.name)
+        if ext != '.json' or '_to_' not in name:
+            continue
+
+        source, target = name.split('_to_')
+        graph.setdefault(source, set()).add(target)
+        graph.setdefault(target, set()).add(source)
+
+    return graph
+
+def shortest(source_type, target_type, graph=None):
+    """ shortest migration path (BFS over rule files)
+
+    Returns:
+        path: list of systems, eg. ['U', 'IBM', 'Surface']
+            None => no path.
+    """
+    graph = edges() if graph is None else graph
+
+    parents = { source_type: None }
+    queue = deque([ source_type ])
+
+    while len(queue) != 0:
+        system = queue.popleft()
+
+        if system == target_type:
+            path = []
+            while system is not None:
+                path.append(system)
+                system = parents[system]
+
+            return path[::-1]
+
+        # sorted => the same path in each call
+        for neighbour in sorted(graph.get(system, ())):
+            if neighbour not in parents:
+                parents[neighbour] = system
+                queue.append(neighbour)
+
+    return None
+
+def _operators(operations):
+    # rule operations => Operator objects
+    # eg. ["u2", [0], ["0", "pi"]] => Operator('u2(0,pi)', [0])
+    operators = []
+
+    for operation in operations:
+        op_type = operation[0]
+        if len(operation) == 3:
+            angle = operation[2]
+            angle = ','.join(angle) if isinstance(angle, list) else angle
+            op_type = f'{op_type}({angle})'
+
+        operators.append( Operator(op_type, list(operation[1])) )
+
+    return operators
+
+def _operations(operators):
+    # Operator objects => rule operations
+    # eg. Operator('u2(0,pi)', [0]) => ["u2", [0], ["0", "pi"]]
+    operations = []
+
+    for operator in operators:
+        operation = [ operator.type, list(operator.operands) ]
+        if operator.angle != '':
+            angle = operator.angle.split(',')
+            operation.append(angle if len(angle) > 1 else angle[0])
+
+        operations.append(operation)
+
+    return operations
+
+def compose(rules, source_type, target_type):
+    """ compose rules(X => source_type) with migration(source_type => target_type)
+
+    rules: X => Y, migration: Y => Z
+        1. dst of each rule is migrated => X => Z
+        2. rules of migration follow, for gates that rules keep unchanged.
+
+    Args:
+        rules: list of rules, eg. [ { "src": [...], "dst": [...] }, ... ]
+        source_type/target_type: systems of the migration to compose with.
+    -------
+    Returns:
+        composed rules
+    """
+    # avoid circular import: migrate => planner
+    from qcpm.migration.migrate import migrate, getMigrater
+
+    composed = []
+    for rule in rules:
+        dst = migrate(_operators(rule['dst']), source_type, target_type)
+        composed.append({ 'src': rule['src'], 'dst': _operations(dst) })
+
+    composed.extend( getMigrater(source_type, target_type).rules )
+
+    return composed
+
+def plan(source_type, target_type):
+    """ composed rule table of the shortest migration path
+
+    the table is cached, thus multi-hop migration could be done
+    by a single Migrater (a single streaming pass).
+
+    Example:
+        plan('U', 'Surface') when only U <=> IBM <=> Surface rule files given:
+            => path: U -> IBM -> Surface
+            => rules: (U => IBM) composed with (IBM => Surface)
+    Returns:
+        rules: list of rules, eg. [ { "src": [...], "dst": [...] }, ... ]
+    """
+    # avoid circular import: migrate => planner
+    from qcpm.migration.migrate import getMigrater
+
+    if (source_type, target_type) in _tables:
+        return _tables[(source_type, target_type)]
+
+    path = shortest(source_type, target_type)
+    if path is None or len(path) < 2:
+        raise FileNotFoundError(f'No migration path from {source_type} to {target_type}')
+
+    rules = getMigrater(path[0], path[1]).rules
+    for i in range(1, len(path) - 1):
+        rules = compose(rules, path[i], path[i + 1])
+
+    _tables[(source_type, target_type)] = rules
+
+    return rules
@@ -0,0 +1,75 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from qcpm.preprocess import preprocess
+from qcpm.expander import Expander
+from qcpm.migration.migrate import migrate
+
+
+# buffer size of the output file
+BUFFER_SIZE = 1 << 16
+
+def migrate_file(src_path, dst_path, source_type, target_type):
+    """ migrate a QASM file to [target_type] without building a Circuit
+
+    streaming: preprocess -> Expander -> migrate -> buffered writer
+        => operators are written as soon as they are migrated,
+           thus memory doesn't grow with the size of file.
+    (no optimization is applied, unlike Circuit(path).save(path, system))
+
+    Args:
+        src_path: path of source QASM file.
+        dst_path: path of output, like ./circuit (default extension: .qasm)
+        source_type: eg. 'IBM'
+        target_type: eg. 'Surface'
+    -------
+    Returns:
+        dst_path: path of output file.
+    """
+    dst_path = dst_path + '.qasm' if os.path.splitext(dst_path)[-1] == '' else dst_path
+
+    ops = preprocess(src_path) # iterator
+    # eg. ['OPENQASM 2.0;\n', 'include "qelib1.inc";\n', 'qreg q[4];\n', ...]
+    # (also yielded when no operator in source file)
+    header = next(ops)
+
+    operators = Expander(source_type)(ops)
+    if source_type != target_type:
+        operators = migrate(operators, source_type, target_type)
+
+    with open(dst_path, 'w', buffering=BUFFER_SIZE) as file:
+        file.write(''.join(header))
+
+        for operator in operators:
+            file.write(operator.output)
+
+    return dst_path
+
+def migrate_dir(src_dir, dst_dir, source_type, target_type, *, workers=None):
+    """ migrate all QASM files in [src_dir] into [dst_dir] in parallel
+
+    eg. src_dir/example.qasm => dst_dir/example.qasm
+
+    Args:
+        src_dir/dst_dir: file folder path. (from => to)
+        source_type: eg. 'IBM'
+        target_type: eg. 'Surface'
+        workers: processes used to migrate.
+            default None => os.cpu_count(), 1 => migrate in current process.
+    -------
+    Returns:
+        list of output files' paths (in the order of sorted source files).
+    """
+    os.makedirs(dst_dir, exist_ok=True)
+
+    files = sorted( file for file in os.listdir(src_dir) if file.endswith('.qasm') )
+    tasks = [ (os.path.join(src_dir, file), os.path.join(dst_dir, file), source_type, target_type)
+        for file in files ]
+
+    if workers == 1 or len(tasks) <= 1:
+        return [ migrate_file(*task) for task in tasks ]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [ pool.submit(migrate_file, *task) for task in tasks ]
+
+        return [ future.result() for future in futures ]
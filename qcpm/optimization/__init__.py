@@ -1,5 +1,9 @@
 from qcpm.optimization.optimizer import optimizer
 from qcpm.optimization.reduction import reduction
 from qcpm.optimization.commutation import commutation
+from qcpm.optimization.fixpoint import fixpoint
+from qcpm.optimization.cancellation import cancellation
+from qcpm.optimization.fused import fused
+from qcpm.optimization.fusion import fusion
 
-__all__ = ['optimizer', 'reduction', 'commutation']
\ No newline at end of file
+__all__ = ['optimizer', 'reduction', 'commutation', 'fixpoint', 'cancellation', 'fused', 'fusion']
\ No newline at end of file
@@ -0,0 +1,127 @@
+from collections import defaultdict
+
+from qcpm.operator import Operator
+from qcpm.optimization.reduction import getReductions
+
+
+# registered inverse pairs besides the reversible rules (both orders)
+INVERSES = [ ('s', 'sdg'), ('t', 'tdg') ]
+
+_inverses = {
+    # should be set by getInverses(when first call)
+    # For example:
+    # "IBM": { ('c', '', 'c', ''): [0, 1], ('h', '', 'h', ''): [0], ... }
+}
+
+##########################
+#                        #
+#     Tool Functions     #
+#                        #
+##########################
+
+def getInverses(system):
+    """ getInverses according to the system
+
+    gather inverse pairs from reversible rules which reduce 2 gates to nothing,
+    eg. {"src": [ ["cx", [0, 1]], ["cx", [0, 1]] ], "dst": []}
+
+    Args:
+        system: 'IBM' / 'Surface' etc.
+    -------
+    Returns:
+        inverses: dict (code, angle, code, angle) => permutation
+            => second.operands == [ first.operands[k] for k in permutation ]
+    """
+    if system in _inverses:
+        return _inverses[system]
+
+    inverses = {}
+    # getReductions(system)[0] => Reducer('reversible')
+    for pattern in getReductions(system)[0].patterns:
+        src, dst = pattern.src, pattern.dst
+        if len(src['operator']) != 2 or len(dst['operator']) != 0:
+            continue
+
+        # eg. src operands: 'abab' => first: 'ab', second: 'ab'
+        size = Operator.count_qubits(src['operator'][0])
+        first, second = src['operands'][:size], src['operands'][size:]
+        if len(set(first)) != size or sorted(first) != sorted(second):
+            continue
+
+        key = (src['operator'][0], src['angles'][0], src['operator'][1], src['angles'][1])
+        inverses[key] = [ first.index(letter) for letter in second ]
+
+    for a, b in INVERSES:
+        for first, second in [ (a, b), (b, a) ]:
+            key = (Operator.convert_type(first), '', Operator.convert_type(second), '')
+            inverses.setdefault(key, [0])
+
+    _inverses[system] = inverses
+
+    return inverses
+
+def inverse(first, second, inverses):
+    """ whether second is the inverse of first
+
+    Args:
+        first, second: Operator object.
+        inverses: dict got by getInverses()
+    """
+    key = (Operator.convert_type(first.type), first.angle,
+        Operator.convert_type(second.type), second.angle)
+    permutation = inverses.get(key)
+
+    if permutation is None or len(permutation) != len(first.operands):
+        return False
+
+    return second.operands == [ first.operands[k] for k in permutation ]
+
+
+##################################
+#                                #
+#     Cancellation Generator     #
+#                                #
+##################################
+
+def cancellation(operators, system='IBM'):
+    """ Cancellation Generator.
+
+    cancel inverse pairs(eg. x x, cx cx, t tdg) across any distance
+    as long as no other gate on their qubits sits between them.
+
+    each qubit keeps a stack of the unmatched gates on it,
+    an operator cancels with the top of stacks when it is the top of
+    all its qubits' stacks, thus cancellation cascades:
+        eg. x h h x => (h h) => x x => nothing
+
+    Args:
+        operators: list of Operator /
+            or a generator which generates Operator thus can compose to be a pipe.
+        system: 'IBM' / 'Surface' etc.
+    """
+    inverses = getInverses(system)
+
+    kept = [] # kept operators, cancelled ones => None
+    stacks = defaultdict(list) # qubit => indexes of unmatched operators in kept
+
+    for operator in operators:
+        tops = [ stacks[qubit][-1] if len(stacks[qubit]) != 0 else None
+            for qubit in operator.operands ]
+        top = tops[0]
+
+        # the last gate on all its qubits should be the same one (and only on these qubits)
+        if top is not None and tops.count(top) == len(tops) \
+                and inverse(kept[top], operator, inverses):
+            kept[top] = None
+
+            for qubit in operator.operands:
+                stacks[qubit].pop()
+        else:
+            for qubit in operator.operands:
+                stacks[qubit].append(len(kept))
+
+            kept.append(operator)
+
+    for operator in kept:
+        if operator is not None:
+            yield operator
@@ -1,14 +1,33 @@
-from collections import deque
-
+from qcpm.optimization.dispatch import GateBuffer
 from qcpm.optimization.invoker import Commutator
+from qcpm.optimization.wire import wires
 
 
 commutators = {
-    # 'IBM': Commutator('IBM').
-    # set in commutation.
+    # ('IBM', True): Commutator('IBM', canonical=True).
+    # set in getCommutator.
 }
 
-def commutation(operators, system='IBM'):
+def getCommutator(system, canonical=True):
+    """ getCommutator according to the system
+
+    init Commutator when first call it.
+    else return the memoized commutator by system
+
+    Args:
+        system: 'IBM' / 'Surface' etc.
+        canonical: only commutate toward the normal form. default True
+    -------
+    Returns:
+        commutator: Commutator object
+    """
+    if (system, canonical) not in commutators:
+        # memoized it
+        commutators[(system, canonical)] = Commutator(system, canonical)
+
+    return commutators[(system, canonical)]
+
+def commutation(operators, system='IBM', window='global'):
     """ Commutation Generator.
 
     apply Commutation Pattern Mapping and yield the Operator after mapping.
@@ -17,15 +36,17 @@ def commutation(operators, system='IBM'):
         operators: list of Operator / 
             or a generator which generates Operator thus can compose to be a pipe.
         system: 'IBM' / 'Surface' etc.
+        window: 'global' => match on the last operators of circuit.
+            'qubit' => match on the last operators of each wire (see WireBuffer)
     """
-    buffer = deque()
     # get/init Commutator by system
-    if system in commutators:
-        commutator = commutators[system]
-    else:
-        commutator = Commutator(system)
-        # memoized it
-        commutators[system] = commutator
+    commutator = getCommutator(system)
+
+    if window == 'qubit':
+        yield from wires(operators, [ commutator ], commutator.max_size)
+        return
+
+    buffer = GateBuffer() # deque keeping gate codes
 
     for operator in operators:
         buffer.append(operator)
@@ -0,0 +1,99 @@
+from collections import deque
+
+from qcpm.operator import Operator
+
+
+############################
+#                          #
+#     Class definition     #
+#                          #
+############################
+
+class GateBuffer(deque):
+    """ deque of Operator which keeps the gate codes alongside.
+
+    buffer.codes[i] <=> Operator.convert_type(buffer[i].type)
+        => eg. buffer: [cx, h, sdg] => codes: ['c', 'h', 'S']
+
+    codes are maintained by append / appendleft / pop / popleft / clear,
+    thus operators in buffer should not be changed in place.
+    """
+    def __init__(self, operators=()):
+        super().__init__()
+
+        self.codes = deque()
+
+        for operator in operators:
+            self.append(operator)
+
+    def append(self, operator):
+        super().append(operator)
+        self.codes.append( Operator.convert_type(operator.type) )
+
+    def appendleft(self, operator):
+        super().appendleft(operator)
+        self.codes.appendleft( Operator.convert_type(operator.type) )
+
+    def pop(self):
+        self.codes.pop()
+        return super().pop()
+
+    def popleft(self):
+        self.codes.popleft()
+        return super().popleft()
+
+    def clear(self):
+        super().clear()
+        self.codes.clear()
+
+
+class SuffixTrie:
+    """ index of patterns by their gate codes in reverse.
+
+    Example:
+        patterns' src operator: ['hh', 'xcx', 'cc', 'c']
+        => trie(reversed): 
+            h - h(0)
+            x - c - x(1)
+            c(3) - c(2)
+
+        codes: [..., 'h', 'c', 'c'] => match: [2, 3]
+    """
+    END = None # key of the indexes of patterns end at this node
+
+    def __init__(self, keys):
+        """
+        Args:
+            keys: list of gate codes of each pattern. eg. ['hh', 'xcx', ...]
+                => index of pattern is the index of key.
+        """
+        self.root = {}
+
+        for index, key in enumerate(keys):
+            node = self.root
+
+            for code in reversed(key):
+                node = node.setdefault(code, {})
+            
+            node.setdefault(self.END, []).append(index)
+
+    def match(self, codes):
+        """ find patterns whose gate codes are a suffix of codes
+
+        Args:
+            codes: sequence of gate codes. eg. GateBuffer.codes
+        -------
+        Returns:
+            sorted indexes of matched patterns.
+        """
+        indexes = []
+        node = self.root
+
+        for code in reversed(codes):
+            node = node.get(code)
+            if node is None:
+                break
+
+            indexes.extend( node.get(self.END, ()) )
+        
+        return sorted(indexes)
@@ -0,0 +1,115 @@
+from collections import deque
+
+from qcpm.optimization.dispatch import GateBuffer
+from qcpm.optimization.reduction import getReductions
+from qcpm.optimization.commutation import getCommutator
+from qcpm.optimization.cancellation import cancellation
+from qcpm.optimization.fusion import fusion
+
+
+# non-shrinking rewrites (commutation, hadamard rules with len(dst) >= len(src))
+# allowed for each input operator, which guarantees termination.
+REWRITE_BUDGET = 4
+
+##########################
+#                        #
+#     Tool Functions     #
+#                        #
+##########################
+
+def _tail(ops, size):
+    # the last [size] operators of ops
+    return tuple( ops[i] for i in range(len(ops) - size, len(ops)) )
+
+def _shrinking(pattern):
+    return len(pattern.dst['operator']) < pattern.size
+
+
+#############################
+#                           #
+#     Fixpoint Optimizer    #
+#                           #
+#############################
+
+def fixpoint(operators, system='IBM'):
+    """ Worklist optimizer: reduction and commutation until nothing changes.
+
+    rotations are folded and inverse pairs are cancelled first (see fusion / cancellation),
+    then operators are pushed on a stack one by one, after each push:
+        1. try reduction patterns then commutation patterns on the end of stack.
+        2. if a pattern is applied => rewind: the rewritten operators are popped 
+            back to the worklist, and re-pushed before the next input operator.
+            thus they are re-examined with their left context.
+
+    no pattern matches at the end of any prefix of the stack when finished,
+    which is the fixpoint of reduction -> commutation -> ... -> reduction
+
+    commutation oscillation is avoided by never commutating the same
+    operators twice, and non-shrinking rewrites are limited by REWRITE_BUDGET.
+
+    Args:
+        operators: list of Operator / 
+            or a generator which generates Operator.
+        system: 'IBM' / 'Surface' etc.
+    """
+    reductions = getReductions(system)
+    # oscillation is avoided by [commutated] thus commutate in both directions,
+    # the normal form(canonical=True) would block commutations which expose
+    # reductions, eg. data_ibm: cycle 67 => 69, depth 29 => 32.
+    commutator = getCommutator(system, canonical=False)
+
+    stack = GateBuffer() # deque keeping gate codes
+    worklist = deque() # rewound operators
+    source = iter( cancellation(fusion(operators, system), system) )
+
+    # frozenset of ids => commutated operators (kept to hold their ids)
+    commutated = {}
+    budget = 0
+
+    def accept(pattern):
+        return budget > 0 or _shrinking(pattern)
+
+    def acceptCommutation(pattern):
+        if budget <= 0:
+            return False
+
+        return frozenset( map(id, _tail(stack, pattern.size)) ) not in commutated
+
+    while True:
+        if len(worklist) != 0:
+            stack.append( worklist.popleft() )
+        else:
+            operator = next(source, None)
+            if operator is None:
+                break
+
+            stack.append(operator)
+            budget += REWRITE_BUDGET
+
+        size = len(stack)
+
+        # Step 1. reduction
+        for reduction in reductions:
+            pattern = reduction.rewrite(stack, accept)
+            if pattern is not None:
+                break
+        
+        # Step 2. commutation
+        else:
+            pattern = commutator.rewrite(stack, acceptCommutation)
+            if pattern is not None:
+                ops = _tail(stack, pattern.size)
+                commutated[ frozenset(map(id, ops)) ] = ops
+
+        if pattern is None:
+            continue
+
+        if not _shrinking(pattern):
+            budget -= 1
+
+        # Step 3. rewind the rewritten operators
+        # eg. [..., h, s, h] => [..., sdg, h, sdg] => rewind 3 operators
+        for _ in range(len(stack) - (size - pattern.size)):
+            worklist.appendleft( stack.pop() )
+
+    yield from stack
@@ -0,0 +1,91 @@
+from qcpm.optimization.dispatch import GateBuffer
+from qcpm.optimization.invoker import Chain
+from qcpm.optimization.reduction import getReductions, getMaxRuleSize
+from qcpm.optimization.commutation import getCommutator
+
+
+_stages = {
+    # should be set by getStages(when first call)
+    # For example:
+    # "IBM": [ (5, Chain([ Reducer('reversible'), Reducer('hadamard') ])), (4, Commutator('IBM')) ]
+}
+
+def getStages(system):
+    """ dispatch table of fused engine according to the system
+
+    Args:
+        system: 'IBM' / 'Surface' etc.
+    -------
+    Returns:
+        stages: list of (window size, invoker)
+            => [ (reduction window, Chain of reducers), (commutation window, commutator) ]
+    """
+    if system not in _stages:
+        reductions = getReductions(system)
+        commutator = getCommutator(system)
+
+        _stages[system] = [
+            ( getMaxRuleSize(reductions), Chain(reductions) ),
+            ( commutator.max_size, commutator ),
+        ]
+
+    return _stages[system]
+
+
+###########################
+#                         #
+#     Fused Generator     #
+#                         #
+###########################
+
+def fused(operators, system='IBM'):
+    """ Fused Generator: reduction and commutation in a single loop.
+
+    yields the same operators as commutation(reduction(operators)),
+    reduction rules of all Reducers are dispatched by one table(Chain),
+    each stage keeps a window(GateBuffer) of its own size:
+        the operator leaving the reduction window enters the commutation window
+        immediately, just like the composed generators,
+    but without passing each operator through two generators.
+
+    Args:
+        operators: list of Operator /
+            or a generator which generates Operator thus can compose to be a pipe.
+        system: 'IBM' / 'Surface' etc.
+    """
+    (reduction_size, reducer), (commutation_size, commutator) = getStages(system)
+
+    reduced = GateBuffer() # window of reduction
+    commutated = GateBuffer() # window of commutation
+
+    def commutate(operator):
+        # commutation step of an operator leaving the reduction window,
+        # returns the operator leaving the commutation window (or None)
+        commutated.append(operator)
+        leaving = commutated.popleft() if len(commutated) > commutation_size else None
+
+        if len(commutated) >= commutator.min_size:
+            commutator(commutated)
+
+        return leaving
+
+    for operator in operators:
+        reduced.append(operator)
+
+        if len(reduced) > reduction_size:
+            leaving = commutate(reduced.popleft())
+            if leaving is not None:
+                yield leaving
+
+        # all reduction rules are dispatched by one SuffixTrie
+        reducer(reduced)
+
+    # the left Operators of reduction => commutation
+    while len(reduced) != 0:
+        leaving = commutate(reduced.popleft())
+        if leaving is not None:
+            yield leaving
+
+    # yield the left Operators
+    while len(commutated) != 0:
+        yield commutated.popleft()
@@ -0,0 +1,129 @@
+import re
+from collections import defaultdict
+from fractions import Fraction
+
+from qcpm.operator import Operator
+
+
+# rotations could be folded: rx(a) rx(b) => rx(a + b)
+ROTATIONS = { 'rx', 'ry', 'rz', 'u1' }
+
+# eg. 'pi', '-pi/2', '3*pi/4', '3pi/4'
+_PI_ANGLE = re.compile(r'^(-)?(?:(\d+)\*?)?pi(?:/(\d+))?$')
+
+##########################
+#                        #
+#     Tool Functions     #
+#                        #
+##########################
+
+def parseAngle(angle):
+    """ parse angle string as multiple of pi
+
+    Example:
+        'pi/2' => Fraction(1, 2), '-3*pi/4' => Fraction(-3, 4), '0' => Fraction(0)
+    Args:
+        angle: angle string of Operator
+    -------
+    Returns:
+        Fraction object, None => not a rational multiple of pi.
+    """
+    angle = angle.replace(' ', '')
+
+    matched = _PI_ANGLE.match(angle)
+    if matched is None:
+        try:
+            return Fraction(0) if float(angle) == 0 else None
+        except ValueError:
+            return None
+
+    sign, numerator, denominator = matched.groups()
+    value = Fraction(int(numerator or 1), int(denominator or 1))
+
+    return -value if sign else value
+
+def formatAngle(value):
+    """ canonical angle string of a multiple of pi in (-pi, pi]
+
+    Example:
+        Fraction(1, 2) => 'pi/2', Fraction(-3, 4) => '-3*pi/4', Fraction(5, 2) => 'pi/2'
+    Args:
+        value: Fraction, multiple of pi
+    """
+    # rotations of 2pi only differ in global phase
+    value = value % 2
+    if value > 1:
+        value -= 2
+
+    if value == 0:
+        return '0'
+
+    sign = '-' if value < 0 else ''
+    numerator, denominator = abs(value.numerator), value.denominator
+
+    angle = 'pi' if numerator == 1 else f'{numerator}*pi'
+    if denominator != 1:
+        angle += f'/{denominator}'
+
+    return sign + angle
+
+
+############################
+#                          #
+#     Fusion Generator     #
+#                          #
+############################
+
+def fusion(operators, system='IBM'):
+    """ Fusion Generator.
+
+    fold consecutive rotations about the same axis on the same qubit,
+    by exact arithmetic of pi multiples.
+        eg. rz(pi/4) rz(pi/4) => rz(pi/2), u1(pi/2) u1(-pi/2) => nothing
+
+    each qubit keeps a stack of the kept gates on it (like cancellation),
+    thus after dropping an identity, the gate before it may be folded again:
+        eg. rz(pi/4) rx(pi) rx(pi) rz(pi/4) => rz(pi/2)
+
+    folded rotations are written with canonical angles (see formatAngle),
+    rotations with other angles(eg. rz(0.3)) are kept as they are.
+
+    Args:
+        operators: list of Operator /
+            or a generator which generates Operator thus can compose to be a pipe.
+        system: 'IBM' / 'Surface' etc. (rotations are the same in all systems)
+    """
+    kept = [] # kept operators, dropped ones => None
+    angles = [] # angles of kept operators (Fraction), None => could not be folded
+    stacks = defaultdict(list) # qubit => indexes of kept operators on it
+
+    for operator in operators:
+        angle = None
+        if operator.type in ROTATIONS:
+            angle = parseAngle(operator.angle)
+
+        if angle is not None:
+            qubit = operator.operands[0]
+            top = stacks[qubit][-1] if len(stacks[qubit]) != 0 else None
+
+            if top is not None and angles[top] is not None and kept[top].type == operator.type:
+                angle += angles[top]
+
+                if formatAngle(angle) == '0':
+                    kept[top], angles[top] = None, None
+                    stacks[qubit].pop()
+                else:
+                    kept[top] = Operator(f'{operator.type}({formatAngle(angle)})', [qubit])
+                    angles[top] = angle
+
+                continue
+
+        for qubit in operator.operands:
+            stacks[qubit].append(len(kept))
+
+        kept.append(operator)
+        angles.append(angle)
+
+    for operator in kept:
+        if operator is not None:
+            yield operator
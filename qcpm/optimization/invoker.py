@@ -1,7 +1,6 @@
-import pkgutil
-import json
-
+from qcpm.common.rules import loadRules
 from qcpm.optimization.pattern import ReductionPattern, CommutationPattern
+from qcpm.optimization.dispatch import SuffixTrie
 
 
 class Invoker:
@@ -12,27 +11,75 @@ class Invoker:
     """
     def __init__(self, name, system='IBM'):
         # patterns data => self.rules
-        data = pkgutil.get_data(__package__, f'/rules/{system}/{name}.json')
-        self.rules = json.loads(data.decode())
+        self.rules = loadRules(__package__, system, name)
 
         self.patterns = [] # should set by subclass
+        self.trie = None # SuffixTrie of patterns, set by subclass through _index()
 
         # the max/min size of operator need to match in all patterns
         self.min_size = len(min(self.rules, key=lambda rule:len(rule['src']))['src'])
         self.max_size = len(max(self.rules, key=lambda rule:len(rule['src']))['src'])
 
+    def _index(self):
+        # index patterns by their gate codes (src operator)
+        self.trie = SuffixTrie([ pattern.src['operator'] for pattern in self.patterns ])
+
     def __call__(self, ops):
         """
         thus Invoker is callable.
         the specific mapping operation will be decided by pattern's type.
         eg. ReductionPattern or CommutationPattern etc.
+
+        patterns are tried in order, each on the current ops.
+        if ops keeps gate codes (GateBuffer), only the patterns whose
+        gate codes match the end of ops are tried (through self.trie).
         
         """
         if len(ops) < self.min_size:
             return
 
-        for pattern in self.patterns:
-            pattern.map(ops)
+        codes = getattr(ops, 'codes', None)
+        if codes is None:
+            for pattern in self.patterns:
+                pattern.map(ops)
+
+            return
+
+        # eg. matched = [2, 5, 7] => try patterns[2], [5], [7] 
+        #   => if patterns[5] changes ops, re-match ops for patterns after 5.
+        matched = self.trie.match(codes)
+        i = 0
+        while i < len(matched):
+            index = matched[i]
+
+            if self.patterns[index].map(ops):
+                matched = [ j for j in self.trie.match(codes) if j > index ]
+                i = 0
+            else:
+                i += 1
+
+
+    def rewrite(self, ops, accept=None):
+        """ apply the first matched pattern on the end of ops
+
+        Args:
+            ops: GateBuffer (keeps gate codes)
+            accept: function(pattern) => whether pattern could be applied now.
+                default None: all patterns could be applied.
+        -------
+        Returns:
+            the applied pattern, None => ops not changed.
+        """
+        for index in self.trie.match(ops.codes):
+            pattern = self.patterns[index]
+
+            if accept is not None and not accept(pattern):
+                continue
+
+            if pattern.map(ops):
+                return pattern
+
+        return None
 
 
 class Reducer(Invoker):
@@ -40,10 +87,30 @@ class Reducer(Invoker):
         super().__init__(name, system)
 
         self.patterns = [ ReductionPattern(**rule) for rule in self.rules ]
+        self._index()
 
 
 class Commutator(Invoker):
-    def __init__(self, system='IBM'):
+    def __init__(self, system='IBM', canonical=True):
+        """
+        Args:
+            canonical: only commutate toward the normal form(no oscillation).
+                => see CommutationPattern._canonical
+        """
         super().__init__('commutation', system)
 
-        self.patterns = [ CommutationPattern(**rule) for rule in self.rules ]
\ No newline at end of file
+        self.patterns = [ CommutationPattern(**rule, canonical=canonical) for rule in self.rules ]
+        self._index()
+
+class Chain(Invoker):
+    """ Invoker applying the patterns of several invokers in order
+
+    patterns are indexed by one SuffixTrie(a single dispatch table),
+    calling Chain([a, b])(ops) <=> a(ops); b(ops) when ops keeps gate codes.
+    """
+    def __init__(self, invokers):
+        self.patterns = [ pattern for invoker in invokers for pattern in invoker.patterns ]
+        self._index()
+
+        self.min_size = min( invoker.min_size for invoker in invokers )
+        self.max_size = max( invoker.max_size for invoker in invokers )
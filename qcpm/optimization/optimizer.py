@@ -1,23 +1,38 @@
 from qcpm.optimization.reduction import reduction
 from qcpm.optimization.commutation import commutation
+from qcpm.optimization.cancellation import cancellation
+from qcpm.optimization.fused import fused
+from qcpm.optimization.fusion import fusion
 
 
-def optimizer(operators, system):
+def optimizer(operators, system, window='global'):
     """ Optimizer which call both the reduction and commutation.
 
-    Optimizer steps: reduce -> commutate
+    Optimizer steps: fuse rotations -> cancel -> reduce -> commutate
 
     Example: 
         call: optimizer(preprocess(path))
     Args:
         operators: list of Operator object / maybe Circuit object
         system: IBM / Surface ...
+        window: 'global' / 'qubit', see reduction / commutation.
+            => 'global' uses the fused engine (same as reduction -> commutation).
     """
+    if window == 'global':
+        return fused(cancellation(fusion(operators, system), system), system)
 
     return commutation(
         reduction(
-            operators, 
-            system
+            cancellation(
+                fusion(
+                    operators,
+                    system
+                ),
+                system
+            ), 
+            system,
+            window
         ),
-        system
+        system,
+        window
     )
\ No newline at end of file
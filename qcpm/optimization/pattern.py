@@ -55,21 +55,48 @@ class ReductionPattern(PatternMeta):
         self.size = len(self.src['operator'])
 
     def _matchTypes(self, ops):
-        return matchTypes(
-            gatherTypes(ops), # opstr like 'xxcxccc'
-            self.src['operator'] # like 'ccc'
-        )
+        """ whether the last [self.size] operators' types match src operator
+
+        only gather types of the last [self.size] operators,
+        or use the gate codes kept in ops (GateBuffer).
+        """
+        if len(ops) < self.size:
+            return False
+
+        codes = getattr(ops, 'codes', ops)
+        # eg. codes: 'xxcxccc', self.size = 3 => 'ccc'
+        tail = [ codes[i] for i in range(len(ops) - self.size, len(ops)) ]
+        if codes is ops:
+            tail = [ Operator.convert_type(op.type) for op in tail ]
+
+        return ''.join(tail) == self.src['operator']
 
     def map(self, ops):
         """ Map reduction.
 
         Example:
             call: pattern.map(ops)
+        -------
+        Returns:
+            True => mapped (ops changed), else False
         """
         # Step 1. test operator matching
         if not self._matchTypes(ops):
             return False
 
+        # compiled: match and build by generated functions
+        if self.COMPILED:
+            values = self.compiled.match(ops, range( len(ops) - self.size, len(ops) ))
+            if values is None:
+                return False
+
+            for i in range(self.size):
+                ops.pop()
+            for operator in self.compiled.build(values):
+                ops.append(operator)
+
+            return True
+
         # Step 2. test operands matching
         # detail matching is implemented in qcpm.pattern.pattern
         # -----------------------------
@@ -101,7 +128,7 @@ class ReductionPattern(PatternMeta):
         dst_operator, dst_operands = self.dst['operator'], self.dst['operands']
         dst_angles = self.dst['angles']
 
-        for _, operator in enumerate(dst_operator):
+        for i, operator in enumerate(dst_operator):
             # eg. operator = 'c' => operands_size = 2
             operands_size = Operator.count_qubits(operator)
             # if books = {'a': 1, 'b': 4, ...}
@@ -120,17 +147,41 @@ class ReductionPattern(PatternMeta):
 
             cur += operands_size
 
+        return True
+
 
 class CommutationPattern(ReductionPattern):
-    def __init__(self, src, dst):
+    def __init__(self, src, dst, canonical=True):
         # self.src/dst = eg. {'operaror': 'ccc', 'operands': 'abbcab'}
         super().__init__(src, dst)
 
+        # canonical => only commutate toward the normal form (see _canonical)
+        self.canonical = canonical
+
+    @staticmethod
+    def _key(op):
+        # order of operators in normal form: by qubits, then by type
+        return (op.operands, op.type)
+
+    def _canonical(self, ops):
+        """ whether commutating the last [self.size] operators moves toward the normal form
+
+        normal form: the sequence of _key(op) is the smallest one,
+            eg. cx q[1],q[2]; cx q[0],q[2]; => cx q[0],q[2]; cx q[1],q[2];
+        thus commutation never swaps back and forth.
+        """
+        keys = [ self._key(ops[i]) for i in range(len(ops) - self.size, len(ops)) ]
+
+        return keys[::-1] < keys
+
     def map(self, ops):
         """ Map commutation.
 
         Example:
             call: pattern.map(ops)
+        -------
+        Returns:
+            True => mapped (ops changed), else False
         """
         # Step 1. test operator matching
         if not self._matchTypes(ops):
@@ -146,6 +197,9 @@ class CommutationPattern(ReductionPattern):
         if not ok:
             return False
 
+        if self.canonical and not self._canonical(ops):
+            return False
+
         # Step 3. commutate
         # -----------------------------
         # example: "abcd" => "dcba"
@@ -155,4 +209,6 @@ class CommutationPattern(ReductionPattern):
             temp.append(ops.pop())
 
         for i in range(self.size):
-            ops.append(temp.popleft())
\ No newline at end of file
+            ops.append(temp.popleft())
+
+        return True
\ No newline at end of file
@@ -1,6 +1,6 @@
-from collections import deque
-
+from qcpm.optimization.dispatch import GateBuffer
 from qcpm.optimization.invoker import Reducer
+from qcpm.optimization.wire import wires
 
 
 _reductions = {
@@ -31,8 +31,8 @@ def getMaxRuleSize(reductions):
     return max(max_sizes)
 
 # should be set by getReductions(system) like:
-# _rule_size_max = getMaxRuleSize(_reductions)
-_rule_size_max = 0
+# _rule_size_max[system] = getMaxRuleSize(_reductions[system])
+_rule_size_max = {}
 
 def getReductions(system):
     """ getReductions according to the system
@@ -60,8 +60,7 @@ def getReductions(system):
     # update global _reductions and _rule_size_max
     _reductions[system] = reductions
 
-    global _rule_size_max
-    _rule_size_max = getMaxRuleSize(_reductions[system])
+    _rule_size_max[system] = getMaxRuleSize(_reductions[system])
 
     return _reductions[system]
 
@@ -72,7 +71,7 @@ def getReductions(system):
 #                             #
 ###############################
 
-def reduction(operators, system='IBM'):
+def reduction(operators, system='IBM', window='global'):
     """ Reduction Generator.
 
     apply Reduction Pattern Mapping and yield the Operator after mapping.
@@ -81,10 +80,17 @@ def reduction(operators, system='IBM'):
         operators: list of Operator / 
             or a generator which generates Operator thus can compose to be a pipe.
         system: 'IBM' / 'Surface' etc.
+        window: 'global' => match on the last operators of circuit.
+            'qubit' => match on the last operators of each wire (see WireBuffer)
     """
-    buffer = deque()
     reductions = getReductions(system)
 
+    if window == 'qubit':
+        yield from wires(operators, reductions, getMaxRuleSize(reductions))
+        return
+
+    buffer = GateBuffer() # deque keeping gate codes
+
     for operator in operators:
         buffer.append(operator)
 
@@ -94,7 +100,7 @@ def reduction(operators, system='IBM'):
         # Case 2. ['(h)hShsh'] => popleft()
         # Case 3. ['hsh'] => reduction(['hsh'])
 
-        if len(buffer) > _rule_size_max:
+        if len(buffer) > _rule_size_max[system]:
             yield buffer.popleft()
 
         for reductionRule in reductions:
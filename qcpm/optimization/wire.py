@@ -0,0 +1,172 @@
+from collections import defaultdict
+
+from qcpm.optimization.dispatch import GateBuffer
+
+
+# limit of operators kept in WireBuffer = LIMIT_FACTOR * window size
+LIMIT_FACTOR = 20
+
+############################
+#                          #
+#     Class definition     #
+#                          #
+############################
+
+class WireBuffer:
+    """ operators buffer with a window on each qubit(wire).
+
+    patterns are matched on the wire-suffix W instead of the global suffix:
+        start from the last operator with its qubits Q, walk backward and
+        gather operators touching Q (Q grows with their qubits),
+        skip operators not touching Q.
+
+    Example: (window size: 2)
+        ops: cx q[0],q[1]; h q[2]; x q[3]; cx q[0],q[1];
+        => W: [cx q[0],q[1]; cx q[0],q[1];] (h, x are skipped)
+
+    each skipped operator commutes with all the gathered operators after it,
+    thus after rewriting W[r:] (r: first changed position in W) as W'[r:]:
+        [..., W[r], ..., skipped, ...] <=> [..., W'[r:], skipped, ...]
+
+    an operator leaves the buffer (popleft) when each of its wires
+    has [size] operators after it, or the buffer is over [limit].
+    """
+    def __init__(self, size, limit=None):
+        """
+        Args:
+            size: window size of each wire (also max size of W).
+            limit: max operators kept in buffer. default LIMIT_FACTOR * size
+        """
+        self.size = size
+        self.limit = LIMIT_FACTOR * size if limit is None else limit
+
+        self.ops = [] # operators in the global order
+        self.counts = defaultdict(int) # qubit => number of operators on it
+
+    def append(self, operator):
+        self.ops.append(operator)
+
+        for qubit in operator.operands:
+            self.counts[qubit] += 1
+
+    def popleft(self):
+        operator = self.ops.pop(0)
+
+        for qubit in operator.operands:
+            self.counts[qubit] -= 1
+
+        return operator
+
+    @property
+    def ready(self):
+        """ whether the first operator should leave the buffer
+
+        """
+        if len(self.ops) == 0:
+            return False
+        if len(self.ops) > self.limit:
+            return True
+
+        # counts[qubit] - 1 => operators after ops[0] on this qubit
+        return all( self.counts[qubit] - 1 >= self.size for qubit in self.ops[0].operands )
+
+    def suffix(self):
+        """ positions of the wire-suffix W in self.ops
+
+        Returns:
+            positions: list of int in ascending order
+        """
+        if len(self.ops) == 0:
+            return []
+
+        positions = [ len(self.ops) - 1 ]
+        qubits = set(self.ops[-1].operands)
+
+        for i in range(len(self.ops) - 2, -1, -1):
+            if len(positions) == self.size:
+                break
+
+            operands = self.ops[i].operands
+            if not qubits.isdisjoint(operands):
+                positions.append(i)
+                qubits.update(operands)
+
+        positions.reverse()
+
+        return positions
+
+    def rewrite(self, invoker):
+        """ apply invoker(Reducer/Commutator) on the wire-suffix
+
+        Args:
+            invoker: Invoker object (callable on GateBuffer)
+        -------
+        Returns:
+            changed[bool]
+        """
+        positions = self.suffix()
+        before = [ self.ops[i] for i in positions ]
+
+        buffer = GateBuffer(before)
+        invoker(buffer)
+        after = list(buffer)
+
+        # r: first changed position in W
+        r = 0
+        while r < min(len(before), len(after)) and before[r] is after[r]:
+            r += 1
+
+        if r == len(before) and r == len(after):
+            return False
+
+        # W[r:] => W'[r:] at the position of W[r]
+        begin = positions[r] if r < len(positions) else len(self.ops)
+        removed = set( map(id, before[r:]) )
+        rest = [ op for op in self.ops[begin:] if id(op) not in removed ]
+
+        for operator in before[r:]:
+            for qubit in operator.operands:
+                self.counts[qubit] -= 1
+        for operator in after[r:]:
+            for qubit in operator.operands:
+                self.counts[qubit] += 1
+
+        self.ops[begin:] = after[r:] + rest
+
+        return True
+
+    def __len__(self):
+        return len(self.ops)
+
+
+###########################
+#                         #
+#     Wire Generator      #
+#                         #
+###########################
+
+def wires(operators, invokers, size):
+    """ apply invokers on the wire-suffix after each operator
+
+    shared by reduction / commutation with window='qubit'
+
+    Args:
+        operators: list of Operator / 
+            or a generator which generates Operator thus can compose to be a pipe.
+        invokers: list of Invoker (Reducer / Commutator)
+        size: window size of each wire.
+    """
+    buffer = WireBuffer(size)
+
+    for operator in operators:
+        buffer.append(operator)
+
+        for invoker in invokers:
+            buffer.rewrite(invoker)
+
+        while buffer.ready:
+            yield buffer.popleft()
+    
+    # yield the left Operators
+    while len(buffer) != 0:
+        yield buffer.popleft()
@@ -0,0 +1,148 @@
+from qcpm.operator import Operator
+
+
+_registry = {
+    # compiled rules, set by compileRule(when first call)
+    # For example:
+    # ('cc', 'abab', ('', ''), '', '', ()): CompiledRule
+}
+
+############################
+#                          #
+#     Class definition     #
+#                          #
+############################
+
+class CompiledRule:
+    """ generated Python functions of a rule(src => dst)
+
+    Example:
+        src: cx q[a],q[b]; rz(pi/2) q[b];  dst: rz(pi/2) q[b]; cx q[a],q[b];
+        =>
+            def match(operators, positions):
+                op0 = operators[positions[0]]
+                op1 = operators[positions[1]]
+                if op0.angle != '' or op1.angle != 'pi/2':
+                    return None
+                a = op0.operands[0]
+                b = op0.operands[1]
+                if op1.operands[0] != b:
+                    return None
+                if a == b:
+                    return None
+                return (a, b)
+
+            def build(values):
+                a, b = values
+                return [ Operator('rz(pi/2)', [b]), Operator('cx', [a, b]) ]
+
+    match() returns the qubits of letters(in order of first appearance) or None,
+    which is the same as PatternMeta.match interprets the rule.
+    """
+    def __init__(self, src, dst):
+        """
+        Args:
+            src/dst: solved pattern data (PatternMeta._solve_pattern)
+                eg. {'operator': 'Xcx', 'operands': 'abaa', 'angles': ["pi/2", '', '']}
+        """
+        # eg. operands: 'abaa' => letters: 'ab', targets: [0, 1, 0, 0]
+        self.letters = ''.join(dict.fromkeys(src['operands']))
+        self.targets = [ self.letters.index(letter) for letter in src['operands'] ]
+
+        self.source = self._generate_match(src) + '\n' + self._generate_build(dst)
+
+        namespace = { 'Operator': Operator }
+        exec(compile(self.source, f'<rule {src["operator"]} => {dst["operator"]}>', 'exec'), namespace)
+
+        self.match = namespace['match']
+        self.build = namespace['build']
+
+    def _generate_match(self, src):
+        lines = [ 'def match(operators, positions):' ]
+        size = len(src['operator'])
+
+        for i in range(size):
+            lines.append(f'    op{i} = operators[positions[{i}]]')
+
+        # Test 1. angles (constant strings)
+        if size != 0:
+            condition = ' or '.join( f'op{i}.angle != {src["angles"][i]!r}' for i in range(size) )
+            lines.append(f'    if {condition}:')
+            lines.append('        return None')
+
+        # Test 2. operands: the first appearance binds the letter, others are checked
+        bound = set()
+        cur = 0
+        for i, operator in enumerate(src['operator']):
+            for k in range( Operator.count_qubits(operator) ):
+                letter = src['operands'][cur]
+
+                if letter in bound:
+                    lines.append(f'    if op{i}.operands[{k}] != {letter}:')
+                    lines.append('        return None')
+                else:
+                    lines.append(f'    {letter} = op{i}.operands[{k}]')
+                    bound.add(letter)
+
+                cur += 1
+
+        # Test 3. no duplicated operand among letters
+        letters = self.letters
+        for i in range(len(letters)):
+            for j in range(i + 1, len(letters)):
+                lines.append(f'    if {letters[i]} == {letters[j]}:')
+                lines.append('        return None')
+
+        lines.append(f'    return ({"".join(letter + ", " for letter in letters)})')
+
+        return '\n'.join(lines) + '\n'
+
+    def _generate_build(self, dst):
+        lines = [ 'def build(values):' ]
+        if len(self.letters) != 0:
+            lines.append(f'    {"".join(letter + ", " for letter in self.letters)}= values')
+
+        operators = []
+        cur = 0
+        for i, operator in enumerate(dst['operator']):
+            size = Operator.count_qubits(operator)
+            operands = ', '.join(dst['operands'][cur: cur + size])
+
+            # eg. 'Y' => 'ry' => 'ry(-pi/2)'
+            op_type = Operator.convert_type(operator, True)
+            if Operator.is_rotation(op_type):
+                op_type = f'{op_type}({dst["angles"][i]})'
+
+            operators.append(f'Operator({op_type!r}, [{operands}])')
+            cur += size
+
+        lines.append(f'    return [ {", ".join(operators)} ]')
+
+        return '\n'.join(lines) + '\n'
+
+
+##########################
+#                        #
+#     Tool Functions     #
+#                        #
+##########################
+
+def compileRule(src, dst):
+    """ get the CompiledRule of rule(src => dst) from registry
+
+    rules with the same data(eg. the same rule in several rule files)
+    share one CompiledRule.
+
+    Args:
+        src/dst: solved pattern data (PatternMeta._solve_pattern)
+    -------
+    Returns:
+        CompiledRule object
+    """
+    key = ( src['operator'], src['operands'], tuple(src['angles']),
+        dst['operator'], dst['operands'], tuple(dst['angles']) )
+
+    if key not in _registry:
+        _registry[key] = CompiledRule(src, dst)
+
+    return _registry[key]
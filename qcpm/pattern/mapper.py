@@ -1,13 +1,12 @@
 import sys
-import json
-import pkgutil
+from time import time
 
-from qcpm.candidate import Candidate, GreedySearchPlan, SearchPlan, RandomlySearchPlan
+from qcpm.candidate import Candidate, GreedySearchPlan, SearchPlan, RandomlySearchPlan, MCTSSearchPlan, BeamSearchPlan, evaluateDepth
 from qcpm.pattern.pattern import Pattern
 from qcpm.operator import Operator
 from qcpm.pattern.positioning import positioning
 
-from qcpm.common import timerDecorator, Timer
+from qcpm.common import timerDecorator, Timer, loadRules
 
 
 ##########################
@@ -60,8 +59,7 @@ class Mapper:
         self.patterns = {} # reset to empty
 
         for system in systems:
-            data = pkgutil.get_data(__package__, f'/rules/{system}/{pattern_type}.json')
-            patterns_data = json.loads(data.decode())
+            patterns_data = loadRules(__package__, system, pattern_type)
 
             self.patterns[system] = []
 
@@ -139,11 +137,14 @@ class Mapper:
         
         return validater
 
-    def find(self, pattern):
+    def find(self, pattern, deadline=None):
         """ according to pattern that finds Candidiates' positions
 
         call [positioning] to find the candidates' positions 
 
+        Args:
+            pattern: Pattern object.
+            deadline: time.time() when validating should stop. default None(no limit)
         """
         # Step 1: get possible candidates' positions like [1, 4, 7] => "xcx"
         #
@@ -156,6 +157,8 @@ class Mapper:
 
         print("\nCandidates: \n")
         for position in validated_positions:
+            if deadline is not None and time() >= deadline:
+                break
             
             # keep candidates(=> Candidate object) in local _candidates[]
             self._candidates.append( Candidate(position, pattern) )
@@ -174,10 +177,20 @@ class Mapper:
             strategy: strategy to generate mapping plan.
                 None => exact mapping
                 'MCM' => Monte Carlo-based plan searching
+                'MCTS' => UCT Monte Carlo tree search
+                'beam' => beam search
             metric: cycle / depth used to calculate value of candidate.
                 default [cycle]
             silence: whether print log info. 
                 True => do not print (default False: print)
+            seed: seed of Monte Carlo simulation (MCM).
+                int / np.random.SeedSequence, default None
+            simulation_workers: threads used to simulate (MCM). default 1
+            iterations: iterations of each decision (MCTS). default None
+            search_time: seconds of plan searching (MCTS). default None(no limit)
+            beam_width: width of beam search (beam). default 8
+            deadline: time.time() when mapping should stop. default None(no limit)
+                => stop collecting candidates, and bound searching (MCM/MCTS).
         -------
         Returns:
             changed[bool]: whether change the target circuit 
@@ -187,6 +200,12 @@ class Mapper:
         strategy = kwargs.get('strategy', None)
         silence = kwargs.get('silence', False)
         system = kwargs.get('system', 'IBM')
+        seed = kwargs.get('seed', None)
+        workers = kwargs.get('simulation_workers', 1)
+        iterations = kwargs.get('iterations', None)
+        search_time = kwargs.get('search_time', None)
+        beam_width = kwargs.get('beam_width', 8)
+        deadline = kwargs.get('deadline', None)
         self.metric = kwargs.get('metric', 'cycle')
 
         # if silence => close all output:
@@ -204,15 +223,23 @@ class Mapper:
         print('\n' + title('Pattern & Candidates'))
         with Timer('Find Candidates'):
             for i, pattern in enumerate(self.patterns[system]):
+                if deadline is not None and time() >= deadline:
+                    print('\nTime budget runs out, stop collecting candidates.')
+                    break
+
                 print('\n' + '-' * 12 + f" {i + 1} " + '-' * 12)
                 print(pattern)
 
-                self.find(pattern)
+                self.find(pattern, deadline)
 
         # 2. filter candidates => (without conflict)
         with Timer('Generate Plans'):
             self._candidates.sort(key=lambda x: (x.begin, x.size, x.end))
 
+            # delta depth of all candidates are evaluated together (memoized)
+            if self.metric == 'depth':
+                evaluateDepth(circuit, self._candidates)
+
             print('\n' + title('Generate Plans') + '\n')
             print('Sorted Candidates: \n')
             print(self._candidates)
@@ -220,7 +247,17 @@ class Mapper:
 
             # should return a Plans object
             if strategy == 'MCM':
-                self.plans = SearchPlan(circuit, self._candidates, self.metric)()
+                self.plans = SearchPlan(circuit, self._candidates, self.metric, 
+                    seed=seed, workers=workers, deadline=deadline)()
+            elif strategy == 'MCTS':
+                if deadline is not None:
+                    remaining = max(deadline - time(), 0)
+                    search_time = remaining if search_time is None else min(search_time, remaining)
+
+                self.plans = MCTSSearchPlan(circuit, self._candidates, self.metric,
+                    seed=seed, iterations=iterations, time_budget=search_time)()
+            elif strategy == 'beam':
+                self.plans = BeamSearchPlan(circuit, self._candidates, self.metric, beam_width, deadline=deadline)
             elif strategy == 'random':
                 self.plans = RandomlySearchPlan(circuit, self._candidates, self.metric)
             else:
@@ -2,6 +2,7 @@ import string
 
 from qcpm.operator import Operator
 from qcpm.common import countDecorator
+from qcpm.pattern.compiler import compileRule
 
 
 class PatternMeta:
@@ -10,6 +11,10 @@ class PatternMeta:
     # => that means: books: {'a': 1, 'b': 2, 'c': -1, ...}
     books = { k:-1 for k in string.ascii_lowercase }
 
+    # True => match by the generated functions (see qcpm.pattern.compiler)
+    # False => interpret pattern data when matching
+    COMPILED = True
+
     def __init__(self, src, dst):
         """
         src/dst: 
@@ -32,6 +37,9 @@ class PatternMeta:
         self.opr = [ self.src['operator'], self.dst['operator'] ]
         self.opd = [ self.src['operands'], self.dst['operands'] ]
         self.angles = [ self.src['angles'], self.dst['angles'] ]
+
+        # generated match / build functions, shared in registry
+        self.compiled = compileRule(self.src, self.dst)
     
     def _solve_pattern(self, target):
         """
@@ -88,6 +96,21 @@ class PatternMeta:
                     - 'books': a map about letter to index. eg. 'a' => 1
                     - 'all': dict containes both targets and books. 
         """
+        if self.COMPILED:
+            values = self.compiled.match(operators, positions)
+            if values is None:
+                return False, None
+
+            targets = [ values[k] for k in self.compiled.targets ]
+            books = dict(zip(self.compiled.letters, values))
+
+            if return_ == 'targets':
+                return True, targets
+            elif return_ == 'books':
+                return True, books
+            elif return_ == 'all':
+                return True, { 'targets': targets, 'books': books }
+
         # reset books
         for k in self.books:
             self.books[k] = -1
@@ -1,3 +1,4 @@
 from qcpm.preprocess.preprocess import preprocess
+from qcpm.preprocess.prescan import prescan
 
-__all__ = ['preprocess']
\ No newline at end of file
+__all__ = ['preprocess', 'prescan']
\ No newline at end of file
@@ -9,6 +9,7 @@ def preprocess(path, ext='.qasm'):
     work as a generator.
     preprocess each line(gate operation) like "cx q[2],q[4];"
         into a Operator object and <yield> it.
+    header lines(list) are always yielded first, even if no operator in file.
 
     Args:
         path: file path
@@ -53,4 +54,8 @@ def preprocess(path, ext='.qasm'):
             except ValueError:
                 # "qreg q[];" will occur this error
                 # keep it in header
-                header.append(line)
\ No newline at end of file
+                header.append(line)
+
+        if flag:
+            # no operator in file => still yield header
+            yield header
\ No newline at end of file
@@ -0,0 +1,102 @@
+import os
+
+from qcpm.operator import Operator
+
+
+def prescan(path, ext='.qasm', *, stop=None):
+    """ cheap scan of QASM file before loading a Circuit
+
+    compute the origin circuit's depth (same as CircuitInfo(...).depth of
+    Circuit(path).origin) and gates/qubits counts straight from lines,
+    without creating Operators, expanding or optimizing.
+
+    the depth only grows while scanning,
+    thus scanning could stop once it reaches [stop].
+
+    Example:
+        prescan(path, stop=101) => stop once depth > 100 (not 'small' any more)
+
+    Args:
+        path: file path
+        ext: extension name, deafult '.qasm'
+        stop: depth to stop scanning. default None => scan the whole file.
+    -------
+    Returns:
+        dict of:
+            size/SQG_num/MQG_num/qubits_num: counts of scanned operators.
+            depth: depth of scanned operators.
+            depth_size: small/medium/large of depth
+            complete: False => stopped by [stop], depth is just a lower bound.
+    """
+    # avoid circular import: circuit => preprocess
+    from qcpm.circuit.info import CircuitInfo
+
+    path = path + ext if os.path.splitext(path)[-1] == '' else path
+
+    size = SQG_num = MQG_num = 0
+    qubits = set()
+    last_layer = {} # qubit => depth
+
+    # CircuitInfo.depth is max(depth_detail[:qubits_num]),
+    # that is max depth of qubits: 0, 1, ..., qubits_num - 1
+    depth = 0
+    complete = True
+
+    with open(path, 'rt') as file:
+        # Skip => OPENQASM 2.0; include "qelib1.inc";
+        next(file), next(file)
+
+        for line in file:
+            # solve line the same as preprocess()
+            # eg. "u2(pi / 2, - pi / 2) q[0];" => 'u2(pi/2,-pi/2)', 'q[0]'
+            _line = line.strip().replace(' ', '')[:-1]
+            left_bound = _line.index('[') - 1
+
+            op_type = _line[:left_bound]
+            if op_type in Operator.reject_type:
+                # "qreg q[];" => header
+                continue
+
+            try:
+                # "q[2],q[4]" => [2, 4]
+                opds = [ int(operand.split('[')[1][:-1]) for operand in _line[left_bound:].split(',') ]
+            except ValueError:
+                continue
+
+            # eg. 'rz(pi/2)' => 'rz', 'u2(...)' => 'u2'
+            op_type = op_type[:2] if op_type[0] in ('r', 'u') else op_type
+
+            size += 1
+            if Operator.count_qubits(op_type) == 1:
+                SQG_num += 1
+            else:
+                MQG_num += 1
+
+            # depth of qubits (see CircuitInfo.compute_depth)
+            if len(opds) == 1:
+                layer = last_layer.get(opds[0], 0) + 1
+            else:
+                layer = max( last_layer.get(opd, 0) for opd in opds ) + 1
+
+            for opd in opds:
+                last_layer[opd] = layer
+
+                if opd < len(qubits):
+                    depth = max(depth, layer)
+
+            # new qubits => more qubits counted in depth
+            qubits_num = len(qubits)
+            qubits.update(opds)
+            for qubit in range(qubits_num, len(qubits)):
+                depth = max(depth, last_layer.get(qubit, 0))
+
+            if stop is not None and depth >= stop:
+                complete = False
+                break
+
+    return {
+        'size': size, 'SQG_num': SQG_num, 'MQG_num': MQG_num,
+        'qubits_num': len(qubits), 'depth': depth,
+        'depth_size': CircuitInfo.evaluate_depth(depth),
+        'complete': complete
+    }
@@ -1,3 +1,4 @@
 from qcpm.statistics.stat import StatReporter
+from qcpm.statistics.manifest import Manifest, hashFile, hashConfig
 
-__all__ = ['StatReporter']
\ No newline at end of file
+__all__ = ['StatReporter', 'Manifest', 'hashFile', 'hashConfig']
\ No newline at end of file
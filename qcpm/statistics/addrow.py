@@ -12,9 +12,11 @@ from qcpm.statistics.info import gatherInfo
 # ]
 
 
-def addRow(csvpath, filename, circuitInfos, metric, time):
-    """ create csv-row and append it
+def createRow(filename, circuitInfos, metric, time):
+    """ create csv-row
 
+    Returns:
+        row: list of values
     """
     info = gatherInfo(circuitInfos, metric)
 
@@ -26,11 +28,17 @@ def addRow(csvpath, filename, circuitInfos, metric, time):
         data.append(info[f'reduce_{key}'])
         data.append('')
 
+    return [
+        filename, 
+        *data,
+        time
+    ]
+
+def addRow(csvpath, row):
+    """ append csv-row (created by createRow)
+
+    """
     with open(csvpath, 'a', newline='') as csvfile:
         writer = csv.writer(csvfile, dialect='excel')
 
-        writer.writerow([
-            filename, 
-            *data,
-            time
-        ])
\ No newline at end of file
+        writer.writerow(row)
\ No newline at end of file
@@ -0,0 +1,92 @@
+import os
+import json
+import hashlib
+
+from qcpm.common.rules import hashRules
+
+
+def hashFile(path):
+    """ content hash of file
+
+    """
+    with open(path, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+def hashConfig(config):
+    """ hash of config options (which decide outputs) and rule files
+
+    stat path and workers don't change outputs, thus are not included.
+
+    """
+    options = { key: value for key, value in vars(config).items()
+        if key not in ('stat_path', 'workers', 'resume') }
+    data = json.dumps(options, sort_keys=True, default=str) + hashRules()
+
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+class Manifest:
+    """ manifest of batch work, used to resume an interrupted batch work
+
+    saved as json file, eg. output_dir/manifest.json
+    {
+        "example.qasm": {
+            "hash": content hash of input file,
+            "config": hash of config and rule files (see hashConfig),
+            "output": output path, "log": log path,
+            "row": row of statistic reporter (list), or None
+            "ignored": depth size when DepthSizeError occurred, or None
+        },
+        ...
+    }
+
+    """
+    NAME = 'manifest.json'
+
+    def __init__(self, folder):
+        self.path = os.path.join(folder, self.NAME)
+        self.entries = {}
+
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as file:
+                self.entries = json.load(file)
+
+    def done(self, file, digest, config):
+        """ whether file was done with the same input and config
+
+        Returns:
+            entry of file if done, else None.
+        """
+        entry = self.entries.get(file)
+        if entry is None or entry['hash'] != digest or entry['config'] != config:
+            return None
+
+        # output may be removed after the work.
+        if entry['ignored'] is None and not os.path.exists(entry['output']):
+            return None
+
+        return entry
+
+    def record(self, file, digest, config, output, log, row=None, ignored=None):
+        """ record done file and save the manifest at once
+
+        thus an interrupted batch work keeps all the files done.
+
+        """
+        self.entries[file] = {
+            'hash': digest, 'config': config,
+            'output': output, 'log': log,
+            'row': row, 'ignored': ignored
+        }
+
+        self.save()
+
+    def save(self):
+        # write to temp file, then replace => manifest is never half written
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+
+        temp = self.path + '.tmp'
+        with open(temp, 'w') as file:
+            json.dump(self.entries, file, indent=4)
+
+        os.replace(temp, self.path)
@@ -2,11 +2,13 @@ import time
 from os.path import dirname, basename
 
 from qcpm.statistics.create import create
-from qcpm.statistics.addrow import addRow
+from qcpm.statistics.addrow import createRow, addRow
 
 
 class StatReporter:
     def __init__(self, path, **kwargs):
+        self.metric = kwargs.get('metric', 'cycle')
+
         if path == None:
             self._state = False
             return
@@ -18,7 +20,6 @@ class StatReporter:
 
         name = self.initCSVName(**kwargs)
         self.path = f'{path}{name}.csv'
-        self.metric = kwargs.get('metric', 'cycle')
 
         create(self.path, self.metric)
 
@@ -42,8 +43,22 @@ class StatReporter:
         return f'{timestamp}_{name}_{optimize}_{strategy}_{system}_{metric}'
 
     def add(self, filename, circuitInfos, time):
+        """ add row of circuit infos
+
+        Returns:
+            row: list of values (also when no need to report)
+        """
+        row = createRow(filename, circuitInfos, self.metric, time)
+        self.addRow(row)
+
+        return row
+
+    def addRow(self, row):
+        """ add row created before, eg. row kept in Manifest
+
+        """
         if self._state == False:
             # no need to report: eg. solving single file.
             return
 
-        addRow(self.path, filename, circuitInfos, self.metric, time)
\ No newline at end of file
+        addRow(self.path, row)
\ No newline at end of file
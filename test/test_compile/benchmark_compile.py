@@ -0,0 +1,70 @@
+import os
+import sys
+sys.path.append('../../')
+
+from copy import deepcopy
+from time import perf_counter
+
+from qcpm import Circuit, Mapper
+from qcpm.pattern import PatternMeta
+from qcpm.expander import Expander
+from qcpm.migration import migrate
+from qcpm.optimization import reduction, commutation
+
+
+originOutput = sys.stdout
+print('Compare interpreted / compiled(generated) matchers of each rule kind: \n')
+mapper = Mapper()
+
+folder = '../data/simulation-test/'
+files = sorted(file for file in os.listdir(folder) if file.startswith('20QBT_45CYC'))
+
+sys.stdout = None
+circuits = [ Circuit(os.path.join(folder, filename), optimize=False) for filename in files ]
+sys.stdout = originOutput
+
+def find(circuit):
+    # Mapper.find of all patterns => candidates' positions
+    mapper.circuit = circuit
+    mapper._candidates = []
+
+    stdout = sys.stdout
+    sys.stdout = None
+    for pattern in mapper.patterns['IBM']:
+        mapper.find(pattern)
+    sys.stdout = stdout
+
+    return [ candidate.pos for candidate in mapper._candidates ]
+
+def output(operators):
+    return [ operator.output for operator in operators ]
+
+kinds = {
+    'pattern': find,
+    'reduction': lambda circuit: output(reduction(deepcopy(circuit.operators), 'IBM')),
+    'commutation': lambda circuit: output(commutation(deepcopy(circuit.operators), 'IBM')),
+    'migration': lambda circuit: output(migrate(deepcopy(circuit.operators), 'IBM', 'Surface')),
+    'expansion': lambda circuit: output(Expander('Surface')(deepcopy(circuit.operators))),
+}
+
+file = open('benchmark_compile.txt', 'w')
+sys.stdout = file
+
+print(f'{"rule kind":<14}{"interpreted(s)":>16}{"compiled(s)":>14}{"speedup":>10}{"same output":>14}')
+
+for kind, work in kinds.items():
+    durations, results = {}, {}
+
+    for compiled in [False, True]:
+        PatternMeta.COMPILED = compiled
+
+        start = perf_counter()
+        results[compiled] = [ work(circuit) for circuit in circuits ]
+        durations[compiled] = perf_counter() - start
+
+    print(f'{kind:<14}{durations[False]:>16.3f}{durations[True]:>14.3f}'
+        f'{durations[False] / durations[True]:>10.2f}{str(results[False] == results[True]):>14}')
+
+PatternMeta.COMPILED = True
+
+sys.stdout = originOutput
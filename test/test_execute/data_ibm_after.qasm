@@ -37,9 +37,7 @@ h q[1];
 x q[1];
 cx q[2],q[3];
 cx q[1],q[3];
-cx q[3],q[0];
-cx q[3],q[1];
 x q[1];
-cx q[3],q[0];
+cx q[3],q[1];
 cx q[1],q[3];
 h q[1];
@@ -37,4 +37,15 @@ circuit.optimize()
 mapper.execute(circuit, strategy='MCM', silence=True)
 print(circuit.info)
 
+
+file = open('execute_beam_strategy.txt', 'w')
+sys.stdout = file
+
+# beam search based mapping:
+circuit = Circuit(circuit_path)
+mapper.execute(circuit, strategy='beam', silence=True)
+circuit.optimize()
+mapper.execute(circuit, strategy='beam', beam_width=None, silence=True)
+print(circuit.info)
+
 sys.stdout = originOutput
\ No newline at end of file
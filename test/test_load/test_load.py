@@ -2,6 +2,7 @@ import sys
 sys.path.append('../../')
 
 from qcpm import Circuit
+from qcpm.preprocess import prescan
 
 
 originOutput = sys.stdout
@@ -27,3 +28,15 @@ print(circuit.info)
 circuit.save('data_surface_after.qasm')
 
 sys.stdout = originOutput
+
+
+# prescan circuit data without loading (compared with circuit.origin)
+with open('prescan.txt', 'w') as file:
+    for circuit_path in ['../data/data_ibm.qasm', '../data/data_surface.qasm', '../data/example.qasm']:
+        origin = Circuit(circuit_path, optimize=False).origin
+        scan = prescan(circuit_path)
+
+        file.write(f'<{circuit_path}>: {scan}\n')
+        file.write(f' - same as origin: {(scan["size"], scan["qubits_num"], scan["depth"]) == (origin.size, origin.qubits_num, origin.depth)}\n')
+        # stop once depth > 10
+        file.write(f' - stop=11: {prescan(circuit_path, stop=11)}\n')
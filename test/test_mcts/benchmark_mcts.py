@@ -0,0 +1,62 @@
+import os
+import sys
+sys.path.append('../../')
+
+from time import perf_counter
+
+from qcpm import Circuit, Mapper
+from qcpm.candidate import SearchPlan, MCTSSearchPlan
+
+
+originOutput = sys.stdout
+print('Compare MCM / MCTS plan searching (saving per second): \n')
+mapper = Mapper()
+
+folder = '../data/simulation-test/'
+files = sorted(file for file in os.listdir(folder) if file.startswith('20QBT_45CYC'))
+
+strategies = {
+    'MCM': lambda circuit, candidates: SearchPlan(circuit, candidates, 'cycle', seed=0),
+    'MCTS': lambda circuit, candidates: MCTSSearchPlan(circuit, candidates, 'cycle', seed=0),
+}
+total = { strategy: [0, 0] for strategy in strategies } # saving, time
+
+file = open('benchmark_mcts.txt', 'w')
+sys.stdout = file
+
+print(f'{"file":<36}{"strategy":<10}{"saving":>8}{"time(s)":>10}{"saving/s":>10}')
+
+for filename in files:
+    # collect candidates of the first mapping
+    stdout = sys.stdout
+    sys.stdout = None
+
+    circuit = Circuit(os.path.join(folder, filename))
+    mapper.circuit = circuit
+    mapper._candidates = []
+    for pattern in mapper.patterns['IBM']:
+        mapper.find(pattern)
+    candidates = sorted(mapper._candidates, key=lambda x: (x.begin, x.size, x.end))
+
+    # delta values are memoized in candidates => calculate ahead
+    for candidate in candidates:
+        candidate.delta('cycle', circuit)
+
+    results = {}
+    for strategy, searcher in strategies.items():
+        start = perf_counter()
+        plans = searcher(circuit, candidates)()
+        results[strategy] = (plans.best.saving, perf_counter() - start)
+
+    sys.stdout = stdout
+
+    for strategy, (saving, duration) in results.items():
+        total[strategy][0] += saving
+        total[strategy][1] += duration
+        print(f'{filename:<36}{strategy:<10}{saving:>8}{duration:>10.3f}{saving / duration:>10.1f}')
+
+print()
+for strategy, (saving, duration) in total.items():
+    print(f'{"total":<36}{strategy:<10}{saving:>8}{duration:>10.3f}{saving / duration:>10.1f}')
+
+sys.stdout = originOutput
@@ -23,4 +23,4 @@ for path in paths:
         patterns = json.load(file)
 
     with open(target_path, 'w') as file:
-        json.dump(convert(patterns, target), file)
\ No newline at end of file
+        json.dump(list(convert(patterns, target)), file)
\ No newline at end of file
@@ -90,20 +90,12 @@ ry(-pi/2) q[0];
 cz q[3],q[0];
 ry(pi/2) q[0];
 x q[1];
-ry(-pi/2) q[1];
-cz q[3],q[1];
-ry(pi/2) q[1];
-x q[1];
-ry(-pi/2) q[3];
-cz q[0],q[3];
-ry(pi/2) q[3];
-x q[1];
-ry(-pi/2) q[3];
-cz q[0],q[3];
-ry(pi/2) q[3];
 ry(-pi/2) q[0];
 cz q[3],q[0];
 ry(pi/2) q[0];
+ry(-pi/2) q[1];
+cz q[3],q[1];
+ry(pi/2) q[1];
 ry(-pi/2) q[3];
 cz q[1],q[3];
 ry(pi/2) q[3];
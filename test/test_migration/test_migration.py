@@ -1,7 +1,58 @@
+import os
 import sys
+import json
+import numpy as np
+from tempfile import TemporaryDirectory
 sys.path.append('../../')
 
 from qcpm import Circuit
+from qcpm.migration import migrate, migrate_many, migrate_file, migrate_dir, getMigrater, convert
+from qcpm.migration.migrate import Migrater
+from qcpm.migration.planner import shortest, compose
+from qcpm.optimization.dispatch import GateBuffer
+
+
+def unitary(operators, size):
+    # unitary matrix of operators on [size] qubits (q[0] => the highest bit)
+    def rotation(theta, phi, lam):
+        return np.array([[np.cos(theta / 2), -np.exp(1j * lam) * np.sin(theta / 2)],
+            [np.exp(1j * phi) * np.sin(theta / 2), np.exp(1j * (phi + lam)) * np.cos(theta / 2)]])
+
+    gates = {
+        'x': lambda: rotation(np.pi, 0, np.pi), 'y': lambda: rotation(np.pi, np.pi / 2, np.pi / 2),
+        'z': lambda: np.diag([1, -1]), 'h': lambda: rotation(np.pi / 2, 0, np.pi),
+        's': lambda: np.diag([1, 1j]), 'sdg': lambda: np.diag([1, -1j]),
+        't': lambda: np.diag([1, np.exp(1j * np.pi / 4)]), 'tdg': lambda: np.diag([1, np.exp(-1j * np.pi / 4)]),
+        'rx': lambda a: rotation(a, -np.pi / 2, np.pi / 2), 'ry': lambda a: rotation(a, 0, 0),
+        'rz': lambda a: np.diag([1, np.exp(1j * a)]), 'u1': lambda a: np.diag([1, np.exp(1j * a)]),
+        'u2': lambda phi, lam: rotation(np.pi / 2, phi, lam), 'u3': rotation
+    }
+
+    matrix = np.eye(2 ** size, dtype=complex)
+    for operator in operators:
+        angles = [ eval(angle, {'pi': np.pi}) for angle in operator.angle.split(',') if angle != '' ]
+        states = np.arange(2 ** size)
+        bits = [ (states >> (size - 1 - qubit)) & 1 for qubit in range(size) ]
+
+        if len(operator.operands) == 2:
+            control, target = operator.operands
+            if operator.type == 'cx':
+                # permutation: flip target when control is 1
+                gate = np.eye(2 ** size)[ states ^ (bits[control] << (size - 1 - target)) ]
+            else: # cz
+                gate = np.diag( 1 - 2 * (bits[control] & bits[target]) )
+        else:
+            gate = np.eye(1)
+            for qubit in range(size):
+                gate = np.kron(gate, gates[operator.type](*angles) if qubit == operator.operands[0] else np.eye(2))
+
+        matrix = gate @ matrix
+
+    return matrix
+
+def equivalent(a, b):
+    # the same unitary up to global phase
+    return np.isclose(abs(np.trace(a.conj().T @ b)), len(a))
 
 
 print('Migration test \n')
@@ -28,3 +79,93 @@ print(f'Try load <{circuit_path}>: ')
 circuit = Circuit(circuit_path)
 
 circuit.save('data_u_after.qasm', system='U')
+
+
+# migrate a batch of circuits in one call (IBM => Surface)
+circuit_paths = ['../data/data_ibm.qasm', '../data/example.qasm']
+circuits = [ Circuit(circuit_path) for circuit_path in circuit_paths ]
+
+with open('migrate_many.txt', 'w') as file:
+    for circuit_path, circuit, operators in zip(circuit_paths, circuits, 
+            migrate_many(circuits, 'IBM', 'Surface')):
+        same = [ op.output for op in operators ] == \
+            [ op.output for op in migrate(circuit, 'IBM', 'Surface') ]
+
+        file.write(f'<{circuit_path}>: {len(circuit.operators)} => {len(operators)} operators, ')
+        file.write(f'same as migrate(): {same}\n')
+
+
+# streaming file to file migration (without building a Circuit)
+migrate_file('../data/data_ibm.qasm', 'data_ibm_stream.qasm', 'IBM', 'Surface')
+# no operator in source file => header(qreg/creg) only
+migrate_file('../data/data_empty.qasm', 'data_empty_stream.qasm', 'IBM', 'Surface')
+
+
+# directory migration: in current process / by 2 processes
+def contents(paths):
+    return [ (os.path.basename(path), open(path, 'r').read()) for path in paths ]
+
+with TemporaryDirectory() as folder, open('migrate_dir.txt', 'w') as file:
+    sequential = migrate_dir('../data/simulation-test/', os.path.join(folder, 'workers_1'), 
+        'IBM', 'Surface', workers=1)
+    parallel = migrate_dir('../data/simulation-test/', os.path.join(folder, 'workers_2'), 
+        'IBM', 'Surface', workers=2)
+
+    file.write(f'<../data/simulation-test/>: {len(sequential)} files, ')
+    file.write(f'workers=2 same as workers=1: {contents(parallel) == contents(sequential)}\n')
+
+
+# shortest migration path of each pair of systems (over rule files)
+with open('migration_plan.txt', 'w') as file:
+    for source in ['IBM', 'Surface', 'U']:
+        for target in ['IBM', 'Surface', 'U']:
+            if source != target:
+                file.write(f'{source} => {target}: {shortest(source, target)}\n')
+
+    # without U <=> Surface rule files => U -> IBM -> Surface
+    graph = { 'U': {'IBM'}, 'IBM': {'U', 'Surface'}, 'Surface': {'IBM'} }
+    path = shortest('U', 'Surface', graph)
+    rules = compose(getMigrater('U', 'IBM').rules, 'IBM', 'Surface')
+
+    file.write(f'\nU => Surface (without direct rules): {path}, composed rules: {len(rules)}\n')
+
+    # composed rules on a real circuit against the direct U => Surface rules
+    circuit_path = '../data/data_ibm_for_u.qasm'
+    circuit = Circuit(circuit_path)
+    operators = list(migrate(circuit, 'IBM', 'U'))
+
+    # streaming as migrate() does, by the composed migrater
+    migrater, buffer, composed = Migrater('U', 'Surface', rules), GateBuffer(), []
+    for operator in operators:
+        buffer.append(operator)
+        if len(buffer) > migrater.max_size:
+            composed.append( buffer.popleft() )
+        composed.extend( migrater(buffer) )
+    composed.extend(buffer)
+
+    direct = list(migrate(operators, 'U', 'Surface'))
+    size = circuit.info.qubits_num
+
+    file.write(f'<{circuit_path}> in U => Surface, composed: {len(composed)} operators, '
+        + f'direct: {len(direct)} operators, same unitary: '
+        + f'{equivalent(unitary(composed, size), unitary(direct, size))}\n')
+
+
+# convert IBM rules into Surface form (deduplicated, lazily generated)
+with open('../../qcpm/optimization/rules/IBM/hadamard.json', 'r') as file:
+    patterns = json.load(file)
+
+with open('../../qcpm/optimization/rules/Surface/hadamard.json', 'r') as file:
+    surface_patterns = json.load(file)
+
+with open('convert.txt', 'w') as file:
+    converted = list(convert(patterns, 'Surface'))
+    file.write(f'hadamard: {len(patterns)} => {len(converted)} patterns, ')
+    file.write(f'same as rule file: {converted == surface_patterns}\n')
+
+    # all migration choices of each gate, eg. h = ry z = z ry = x ry
+    converted = list(convert(patterns, 'Surface', alternatives=True))
+    file.write(f'hadamard (alternatives): {len(converted)} patterns\n')
+
+    converted = list(convert(patterns, 'Surface', alternatives=True, limit=4))
+    file.write(f'hadamard (alternatives, limit=4): {len(converted)} patterns\n')
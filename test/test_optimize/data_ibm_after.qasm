@@ -40,11 +40,7 @@ cx q[2],q[3];
 cx q[1],q[3];
 cx q[3],q[0];
 x q[1];
-cx q[3],q[1];
-x q[1];
-cx q[0],q[3];
-x q[1];
-cx q[0],q[3];
 cx q[3],q[0];
+cx q[3],q[1];
 cx q[1],q[3];
 h q[1];
@@ -43,4 +43,36 @@ print(circuit.info)
 
 circuit.save('data_surface_after.qasm')
 
+
+file = open('optimize_compare.txt', 'w')
+sys.stdout = file
+
+# compare: reduction -> commutation passes / worklist fixpoint optimizer
+for circuit_path, system in [('../data/data_ibm.qasm', 'IBM'), ('../data/data_surface.qasm', 'Surface')]:
+    print(f'Try optimize <{circuit_path}> by passes / fixpoint: ')
+
+    circuit = Circuit(circuit_path, system=system, optimize=False)
+    circuit.optimize(iteration=3) # reduction -> commutation (×3) -> reduction
+    print(circuit.info)
+
+    circuit = Circuit(circuit_path, system=system, optimize=False)
+    circuit.optimize() # worklist fixpoint
+    print(circuit.info)
+
+
+file = open('optimize_window.txt', 'w')
+sys.stdout = file
+
+# compare: global window / per-qubit window of reduction -> commutation passes
+for circuit_path, system in [('../data/data_ibm.qasm', 'IBM'), ('../data/data_surface.qasm', 'Surface')]:
+    print(f'Try optimize <{circuit_path}> by global / qubit window: ')
+
+    circuit = Circuit(circuit_path, system=system, optimize=False)
+    circuit.optimize(iteration=3) # window='global'
+    print(circuit.info)
+
+    circuit = Circuit(circuit_path, system=system, optimize=False)
+    circuit.optimize(iteration=3, window='qubit')
+    print(circuit.info)
+
 sys.stdout = originOutput
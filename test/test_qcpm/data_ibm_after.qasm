@@ -12,12 +12,12 @@ cx q[0],q[3];
 cx q[3],q[1];
 cx q[2],q[0];
 cx q[1],q[2];
-cx q[3],q[1];
 cx q[2],q[1];
+cx q[3],q[1];
 x q[3];
 x q[1];
-cx q[2],q[3];
 cx q[1],q[3];
+cx q[2],q[3];
 cx q[3],q[0];
 h q[1];
 rz(0.3) q[1];
@@ -25,8 +25,8 @@ cx q[1],q[3];
 h q[1];
 cx q[0],q[1];
 x q[1];
-cx q[2],q[3];
 cx q[1],q[3];
+cx q[2],q[3];
 x q[1];
 cx q[0],q[1];
 cx q[1],q[3];
@@ -35,9 +35,9 @@ rz(0.6) q[2];
 h q[2];
 h q[1];
 x q[1];
-cx q[2],q[3];
 cx q[1],q[3];
-cx q[3],q[1];
+cx q[2],q[3];
 x q[1];
+cx q[3],q[1];
 cx q[1],q[3];
 h q[1];
@@ -3,8 +3,8 @@ include "qelib1.inc";
 qreg q[20];
 cx q[12],q[9];
 cx q[6],q[12];
-cx q[7],q[6];
 cx q[8],q[6];
+cx q[7],q[6];
 cx q[6],q[10];
 cx q[11],q[6];
 cx q[8],q[7];
@@ -13,13 +13,7 @@ cx q[7],q[6];
 cx q[15],q[7];
 cx q[7],q[13];
 cx q[12],q[9];
+cx q[6],q[9];
 cx q[13],q[9];
-cx q[9],q[10];
 cx q[6],q[10];
-cx q[12],q[10];
-cx q[6],q[10];
-cx q[9],q[10];
-cx q[6],q[9];
-cx q[12],q[10];
 cx q[9],q[10];
-cx q[6],q[10];
@@ -14,10 +14,10 @@ cx q[18],q[14];
 cx q[16],q[8];
 cx q[3],q[1];
 cx q[11],q[9];
-cx q[4],q[6];
 cx q[4],q[13];
+cx q[4],q[6];
 cx q[12],q[3];
-cx q[7],q[1];
+cx q[2],q[7];
 cx q[12],q[9];
 cx q[17],q[0];
 cx q[5],q[11];
@@ -25,14 +25,13 @@ cx q[4],q[10];
 cx q[10],q[13];
 cx q[19],q[4];
 cx q[16],q[12];
-cx q[2],q[7];
+cx q[7],q[1];
 cx q[4],q[6];
 cx q[8],q[19];
+cx q[14],q[15];
 cx q[14],q[4];
 cx q[19],q[15];
-cx q[7],q[1];
 cx q[4],q[13];
-cx q[14],q[15];
 cx q[12],q[3];
 cx q[15],q[7];
 cx q[1],q[6];
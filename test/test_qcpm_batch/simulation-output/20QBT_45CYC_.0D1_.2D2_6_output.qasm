@@ -16,8 +16,8 @@ cx q[11],q[1];
 cx q[7],q[17];
 cx q[3],q[1];
 cx q[16],q[0];
-cx q[14],q[16];
 cx q[14],q[6];
+cx q[14],q[16];
 cx q[8],q[5];
 cx q[16],q[11];
 cx q[7],q[4];
@@ -27,18 +27,18 @@ cx q[3],q[11];
 cx q[19],q[7];
 cx q[11],q[0];
 cx q[12],q[2];
-cx q[11],q[1];
 cx q[6],q[1];
+cx q[11],q[1];
 cx q[0],q[13];
-cx q[17],q[8];
 cx q[18],q[8];
+cx q[17],q[8];
 cx q[7],q[17];
 cx q[19],q[7];
 cx q[4],q[17];
 cx q[3],q[11];
 cx q[17],q[8];
-cx q[11],q[1];
 cx q[6],q[1];
+cx q[11],q[1];
 cx q[0],q[19];
 cx q[1],q[18];
 cx q[19],q[17];
@@ -51,8 +51,8 @@ cx q[17],q[8];
 cx q[1],q[9];
 cx q[7],q[17];
 cx q[16],q[0];
-cx q[12],q[9];
 cx q[12],q[2];
+cx q[12],q[9];
 cx q[18],q[10];
 cx q[8],q[5];
 cx q[19],q[17];
@@ -8,7 +8,7 @@ cx q[16],q[12];
 cx q[14],q[18];
 cx q[7],q[8];
 cx q[0],q[5];
-cx q[5],q[18];
+cx q[5],q[14];
 cx q[0],q[9];
 cx q[14],q[18];
 cx q[4],q[7];
@@ -18,20 +18,19 @@ cx q[3],q[11];
 cx q[1],q[7];
 cx q[9],q[1];
 cx q[18],q[13];
-cx q[5],q[14];
 cx q[1],q[4];
 cx q[2],q[7];
 cx q[11],q[9];
 cx q[15],q[4];
 cx q[3],q[11];
-cx q[6],q[18];
 cx q[6],q[2];
 cx q[0],q[18];
+cx q[6],q[18];
 cx q[19],q[9];
 cx q[8],q[12];
-cx q[0],q[13];
 cx q[4],q[7];
 cx q[1],q[4];
+cx q[6],q[13];
 cx q[0],q[9];
 cx q[15],q[4];
 cx q[1],q[7];
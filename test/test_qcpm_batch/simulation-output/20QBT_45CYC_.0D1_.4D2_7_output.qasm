@@ -15,10 +15,11 @@ cx q[17],q[2];
 cx q[11],q[14];
 cx q[0],q[3];
 cx q[8],q[0];
-cx q[4],q[17];
 cx q[19],q[17];
-cx q[0],q[14];
+cx q[4],q[17];
 cx q[14],q[9];
+cx q[9],q[6];
+cx q[0],q[14];
 cx q[17],q[2];
 cx q[3],q[10];
 cx q[13],q[16];
@@ -34,27 +35,24 @@ cx q[11],q[7];
 cx q[5],q[2];
 cx q[15],q[16];
 cx q[3],q[18];
-cx q[0],q[9];
 cx q[17],q[2];
-cx q[8],q[11];
 cx q[4],q[19];
 cx q[14],q[6];
-cx q[10],q[18];
-cx q[17],q[12];
+cx q[19],q[10];
 cx q[2],q[12];
+cx q[17],q[12];
 cx q[19],q[17];
 cx q[13],q[5];
-cx q[19],q[10];
+cx q[10],q[18];
 cx q[16],q[5];
 cx q[0],q[3];
-cx q[3],q[18];
 cx q[19],q[18];
 cx q[9],q[6];
 cx q[4],q[19];
 cx q[0],q[14];
 cx q[16],q[19];
 cx q[15],q[5];
-cx q[6],q[10];
+cx q[3],q[18];
 cx q[17],q[1];
 cx q[16],q[17];
 cx q[7],q[4];
@@ -63,16 +61,18 @@ cx q[0],q[9];
 cx q[17],q[2];
 cx q[14],q[9];
 cx q[5],q[2];
-cx q[7],q[14];
-cx q[17],q[12];
+cx q[14],q[3];
 cx q[2],q[12];
+cx q[17],q[12];
+cx q[7],q[14];
 cx q[13],q[5];
 cx q[19],q[17];
 cx q[17],q[2];
 cx q[16],q[5];
+cx q[8],q[11];
 cx q[17],q[1];
 cx q[15],q[5];
-cx q[10],q[18];
+cx q[6],q[10];
 cx q[4],q[16];
 cx q[2],q[12];
 cx q[12],q[1];
@@ -87,10 +87,12 @@ cx q[0],q[9];
 cx q[2],q[12];
 cx q[19],q[17];
 cx q[2],q[1];
+cx q[15],q[13];
 cx q[11],q[7];
 cx q[17],q[2];
 cx q[15],q[16];
 cx q[3],q[19];
+cx q[10],q[18];
 cx q[12],q[1];
 cx q[11],q[4];
 cx q[2],q[12];
@@ -98,15 +100,15 @@ cx q[14],q[9];
 cx q[16],q[5];
 cx q[19],q[12];
 cx q[18],q[12];
-cx q[6],q[10];
 cx q[13],q[5];
+cx q[6],q[10];
+cx q[15],q[5];
 cx q[8],q[11];
 cx q[14],q[4];
 cx q[4],q[16];
 cx q[14],q[3];
 cx q[10],q[18];
 cx q[16],q[19];
-cx q[15],q[13];
 cx q[7],q[14];
 cx q[18],q[12];
 cx q[16],q[5];
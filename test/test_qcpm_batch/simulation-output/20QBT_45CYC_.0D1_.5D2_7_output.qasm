@@ -23,8 +23,8 @@ cx q[14],q[2];
 cx q[16],q[0];
 cx q[6],q[19];
 cx q[14],q[16];
-cx q[9],q[13];
 cx q[9],q[1];
+cx q[9],q[13];
 cx q[19],q[16];
 cx q[15],q[11];
 cx q[13],q[7];
@@ -36,7 +36,6 @@ cx q[7],q[3];
 cx q[9],q[13];
 cx q[10],q[4];
 cx q[19],q[14];
-cx q[17],q[15];
 cx q[5],q[11];
 cx q[18],q[3];
 cx q[8],q[2];
@@ -92,19 +91,21 @@ cx q[0],q[3];
 cx q[6],q[19];
 cx q[10],q[4];
 cx q[5],q[11];
-cx q[8],q[18];
+cx q[17],q[15];
 cx q[2],q[18];
+cx q[8],q[18];
 cx q[1],q[13];
 cx q[15],q[10];
 cx q[19],q[14];
 cx q[5],q[8];
-cx q[18],q[0];
-cx q[11],q[9];
 cx q[0],q[12];
+cx q[11],q[9];
+cx q[18],q[0];
+cx q[3],q[12];
 cx q[13],q[7];
 cx q[11],q[8];
 cx q[10],q[9];
-cx q[3],q[12];
+cx q[18],q[12];
 cx q[11],q[10];
 cx q[4],q[13];
 cx q[5],q[8];
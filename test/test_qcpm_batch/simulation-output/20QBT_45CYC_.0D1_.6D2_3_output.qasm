@@ -32,6 +32,7 @@ cx q[5],q[19];
 cx q[13],q[4];
 cx q[9],q[7];
 cx q[19],q[8];
+cx q[5],q[15];
 cx q[6],q[3];
 cx q[12],q[1];
 cx q[3],q[14];
@@ -83,17 +84,15 @@ cx q[16],q[12];
 cx q[12],q[1];
 cx q[19],q[8];
 cx q[0],q[16];
-cx q[9],q[7];
 cx q[6],q[2];
 cx q[17],q[11];
 cx q[13],q[4];
 cx q[8],q[1];
-cx q[7],q[2];
 cx q[5],q[19];
 cx q[13],q[11];
 cx q[4],q[11];
 cx q[18],q[6];
-cx q[9],q[2];
+cx q[7],q[2];
 cx q[3],q[0];
 cx q[14],q[16];
 cx q[19],q[10];
@@ -101,6 +100,7 @@ cx q[0],q[16];
 cx q[2],q[3];
 cx q[5],q[15];
 cx q[4],q[17];
+cx q[9],q[7];
 cx q[8],q[10];
 cx q[9],q[5];
 cx q[6],q[2];
@@ -109,7 +109,7 @@ cx q[17],q[19];
 cx q[14],q[15];
 cx q[1],q[10];
 cx q[15],q[12];
-cx q[11],q[10];
+cx q[11],q[8];
 cx q[13],q[17];
 cx q[8],q[10];
 cx q[17],q[15];
@@ -117,7 +117,6 @@ cx q[7],q[5];
 cx q[6],q[14];
 cx q[15],q[16];
 cx q[7],q[13];
-cx q[11],q[8];
 cx q[7],q[2];
 cx q[15],q[19];
 cx q[14],q[16];
@@ -137,7 +136,7 @@ cx q[14],q[12];
 cx q[19],q[1];
 cx q[1],q[10];
 cx q[14],q[15];
-cx q[11],q[1];
+cx q[11],q[8];
 cx q[5],q[15];
 cx q[9],q[7];
 cx q[14],q[16];
@@ -157,6 +156,7 @@ cx q[7],q[13];
 cx q[2],q[5];
 cx q[4],q[17];
 cx q[3],q[0];
+cx q[11],q[8];
 cx q[7],q[5];
 cx q[14],q[15];
 cx q[16],q[12];
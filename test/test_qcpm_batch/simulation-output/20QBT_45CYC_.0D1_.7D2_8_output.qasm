@@ -13,8 +13,8 @@ cx q[13],q[5];
 cx q[16],q[3];
 cx q[0],q[6];
 cx q[8],q[7];
-cx q[2],q[9];
 cx q[18],q[9];
+cx q[2],q[9];
 cx q[8],q[13];
 cx q[3],q[18];
 cx q[1],q[15];
@@ -30,8 +30,8 @@ cx q[1],q[5];
 cx q[0],q[10];
 cx q[15],q[2];
 cx q[8],q[7];
-cx q[13],q[3];
 cx q[16],q[3];
+cx q[13],q[3];
 cx q[6],q[10];
 cx q[5],q[18];
 cx q[4],q[11];
@@ -48,27 +48,27 @@ cx q[8],q[7];
 cx q[0],q[10];
 cx q[17],q[13];
 cx q[9],q[11];
+cx q[14],q[19];
+cx q[0],q[6];
 cx q[5],q[18];
 cx q[2],q[9];
 cx q[4],q[11];
 cx q[1],q[15];
 cx q[8],q[17];
 cx q[1],q[5];
+cx q[19],q[17];
 cx q[15],q[2];
 cx q[9],q[11];
 cx q[3],q[4];
-cx q[18],q[12];
 cx q[9],q[12];
+cx q[3],q[18];
 cx q[15],q[5];
 cx q[7],q[13];
-cx q[3],q[18];
-cx q[19],q[17];
+cx q[18],q[12];
+cx q[14],q[19];
 cx q[10],q[4];
-cx q[18],q[11];
 cx q[1],q[15];
 cx q[15],q[2];
-cx q[19],q[16];
-cx q[0],q[6];
 cx q[6],q[10];
 cx q[17],q[16];
 cx q[19],q[6];
@@ -78,13 +78,12 @@ cx q[3],q[10];
 cx q[1],q[15];
 cx q[7],q[1];
 cx q[15],q[5];
-cx q[18],q[12];
 cx q[16],q[4];
 cx q[13],q[3];
+cx q[18],q[11];
 cx q[1],q[5];
 cx q[3],q[4];
 cx q[9],q[12];
-cx q[19],q[17];
 cx q[8],q[7];
 cx q[0],q[16];
 cx q[7],q[13];
@@ -97,11 +96,11 @@ cx q[6],q[10];
 cx q[17],q[0];
 cx q[2],q[9];
 cx q[7],q[1];
-cx q[0],q[10];
+cx q[0],q[6];
 cx q[14],q[8];
 cx q[1],q[15];
-cx q[0],q[16];
 cx q[19],q[16];
+cx q[0],q[16];
 cx q[6],q[10];
 cx q[16],q[3];
 cx q[18],q[9];
@@ -110,7 +109,6 @@ cx q[4],q[11];
 cx q[17],q[13];
 cx q[3],q[10];
 cx q[7],q[17];
-cx q[0],q[6];
 cx q[9],q[12];
 cx q[8],q[18];
 cx q[10],q[4];
@@ -159,6 +157,7 @@ cx q[19],q[0];
 cx q[13],q[18];
 cx q[5],q[3];
 cx q[1],q[2];
+cx q[15],q[5];
 cx q[7],q[13];
 cx q[14],q[8];
 cx q[19],q[17];
@@ -166,9 +165,8 @@ cx q[16],q[4];
 cx q[15],q[2];
 cx q[7],q[1];
 cx q[18],q[12];
-cx q[8],q[17];
 cx q[8],q[7];
-cx q[15],q[5];
+cx q[8],q[17];
 cx q[11],q[12];
 cx q[0],q[16];
 cx q[1],q[15];
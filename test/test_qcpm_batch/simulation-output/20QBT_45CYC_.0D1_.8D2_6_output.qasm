@@ -5,7 +5,7 @@ cx q[2],q[13];
 cx q[1],q[9];
 cx q[18],q[10];
 cx q[15],q[19];
-cx q[11],q[15];
+cx q[11],q[4];
 cx q[8],q[17];
 cx q[12],q[5];
 cx q[8],q[13];
@@ -31,7 +31,6 @@ cx q[19],q[3];
 cx q[5],q[10];
 cx q[1],q[9];
 cx q[8],q[13];
-cx q[11],q[4];
 cx q[13],q[0];
 cx q[10],q[6];
 cx q[4],q[15];
@@ -40,8 +39,8 @@ cx q[9],q[14];
 cx q[8],q[17];
 cx q[13],q[6];
 cx q[11],q[16];
-cx q[12],q[15];
 cx q[12],q[2];
+cx q[12],q[15];
 cx q[3],q[10];
 cx q[2],q[18];
 cx q[14],q[17];
@@ -51,10 +50,10 @@ cx q[16],q[1];
 cx q[9],q[17];
 cx q[12],q[5];
 cx q[11],q[4];
+cx q[18],q[6];
 cx q[14],q[8];
 cx q[4],q[5];
 cx q[1],q[12];
-cx q[10],q[6];
 cx q[5],q[3];
 cx q[16],q[12];
 cx q[11],q[4];
@@ -75,6 +74,7 @@ cx q[12],q[2];
 cx q[15],q[5];
 cx q[17],q[7];
 cx q[2],q[8];
+cx q[11],q[4];
 cx q[9],q[14];
 cx q[12],q[15];
 cx q[5],q[10];
@@ -83,7 +83,6 @@ cx q[3],q[10];
 cx q[15],q[5];
 cx q[18],q[13];
 cx q[9],q[8];
-cx q[11],q[4];
 cx q[13],q[7];
 cx q[1],q[9];
 cx q[12],q[15];
@@ -1,4 +1,7 @@
+import os
 import sys
+import csv
+from tempfile import TemporaryDirectory
 sys.path.append('../../')
 
 from qcpm import QCPatternMapper
@@ -35,4 +38,30 @@ config = {
     'metric': 'cycle' # cycle or depth
 }
 
-QCPM.execute('../data/simulation-test/', './simulation-output/', **config)
\ No newline at end of file
+QCPM.execute('../data/simulation-test/', './simulation-output/', **config)
+
+
+# the same batch work by a process pool (workers: processes, default 1)
+def rows(path):
+    # rows of statistic csv without time column
+    with open(path, 'r') as file:
+        return [ row[:-1] for row in csv.reader(file) ]
+
+def outputs(folder):
+    files = sorted(os.listdir(folder))
+
+    return files, [ open(os.path.join(folder, file), 'r').read() for file in files ]
+
+stat_path = QCPM.reporter.path
+
+with TemporaryDirectory() as folder:
+    output_dir = os.path.join(folder, 'output', '')
+    os.makedirs(output_dir)
+
+    QCPM_pool = QCPatternMapper(logs=os.path.join(folder, ''))
+    QCPM_pool.execute('../data/simulation-test/', output_dir, 
+        **{ **config, 'stat': os.path.join(folder, '') }, workers=2)
+
+    with open('workers.txt', 'w') as file:
+        file.write(f'workers=2 same rows as workers=1: {rows(QCPM_pool.reporter.path) == rows(stat_path)}\n')
+        file.write(f'workers=2 same outputs as workers=1: {outputs(output_dir) == outputs("./simulation-output/")}\n')
\ No newline at end of file
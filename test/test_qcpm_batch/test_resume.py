@@ -0,0 +1,73 @@
+import os
+import sys
+import json
+import shutil
+from tempfile import TemporaryDirectory
+sys.path.append('../../')
+
+from qcpm import QCPatternMapper
+
+
+# resume batch work from output_dir/manifest.json (fresh temp dirs each run)
+files = ['20QBT_45CYC_.0D1_.1D2_2.qasm', '20QBT_45CYC_.0D1_.1D2_3.qasm']
+
+with TemporaryDirectory() as folder:
+    input_dir = os.path.join(folder, 'data', '')
+    output_dir = os.path.join(folder, 'output', '')
+    logs = os.path.join(folder, 'logs', '')
+
+    for path in [input_dir, output_dir, logs]:
+        os.makedirs(path)
+    for file in files:
+        shutil.copy(f'../data/simulation-test/{file}', input_dir)
+
+    QCPM = QCPatternMapper(logs=logs)
+
+    def execute(output, **config):
+        # stdout of batch work => lines of report
+        ## (executing a file restores sys.stdout, thus only read when all skipped)
+        originOutput = sys.stdout
+        with open(os.path.join(folder, 'report.txt'), 'w') as file:
+            sys.stdout = file
+            QCPM.execute(input_dir, output, system='IBM', **config)
+        sys.stdout = originOutput
+
+        with open(os.path.join(folder, 'report.txt'), 'r') as file:
+            return file.read()
+
+    def manifest(output):
+        path = os.path.join(output, 'manifest.json')
+        if not os.path.exists(path):
+            return None
+
+        with open(path, 'r') as file:
+            return json.load(file)
+
+    with open('resume.txt', 'w') as file:
+        # 1. without resume => no manifest in output dir
+        execute(output_dir)
+        file.write(f'resume=False, manifest: {manifest(output_dir) is not None}\n')
+
+        # 2. resume => second work skips all files done in first work
+        execute(output_dir, resume=True)
+        entries = manifest(output_dir)
+
+        report = execute(output_dir, resume=True)
+        file.write(f'resume=True, manifest entries: {len(entries)}, '
+            + f'skipped: {report.count("SKIP it")}, '
+            + f'manifest unchanged: {manifest(output_dir) == entries}\n')
+
+        # 3. input changed => executed again
+        with open(os.path.join(input_dir, files[0]), 'a') as qasm:
+            qasm.write('cx q[0],q[1];\n')
+
+        execute(output_dir, resume=True)
+        changed = manifest(output_dir)
+        file.write(f'changed input, executed again: '
+            + f'{[ name for name in files if changed[name] != entries[name] ]}\n')
+
+        # 4. ignored by depth size => ignored again (not reported as done)
+        execute(output_dir, resume=True, depth_size='medium')
+        report = execute(output_dir, resume=True, depth_size='medium')
+        file.write(f'depth_size=medium, ignored: {report.count("IGNORE it")}, '
+            + f'skipped: {report.count("SKIP it")}\n')
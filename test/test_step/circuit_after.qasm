@@ -35,7 +35,6 @@ t q[4];
 cx q[4],q[5];
 cx q[0],q[4];
 cx q[5],q[0];
-h q[4];
 h q[5];
 t q[3];
 t q[2];
@@ -52,7 +51,6 @@ cx q[5],q[2];
 cx q[3],q[5];
 cx q[2],q[3];
 h q[5];
-h q[4];
 t q[0];
 t q[5];
 t q[4];
@@ -76,8 +74,8 @@ t q[5];
 cx q[2],q[3];
 cx q[5],q[2];
 cx q[3],q[5];
-cx q[4],q[2];
-cx q[1],q[2];
+cx q[4],q[1];
+cx q[4],q[1];
 cx q[1],q[2];
 cx q[4],q[1];
 tdg q[2];
@@ -88,7 +86,6 @@ t q[5];
 cx q[5],q[2];
 cx q[3],q[5];
 cx q[2],q[3];
-h q[5];
 h q[4];
 t q[1];
 t q[0];
@@ -104,8 +101,6 @@ t q[4];
 cx q[4],q[0];
 cx q[1],q[4];
 cx q[0],q[1];
-h q[4];
-h q[5];
 t q[3];
 t q[2];
 t q[5];
@@ -121,7 +116,6 @@ cx q[5],q[2];
 cx q[3],q[5];
 cx q[2],q[3];
 h q[5];
-h q[4];
 t q[5];
 t q[3];
 t q[4];
@@ -136,7 +130,6 @@ t q[4];
 cx q[4],q[3];
 cx q[5],q[4];
 cx q[3],q[5];
-h q[4];
 h q[3];
 t q[1];
 t q[0];
@@ -153,7 +146,6 @@ cx q[3],q[0];
 cx q[1],q[3];
 cx q[0],q[1];
 h q[3];
-h q[4];
 t q[5];
 t q[3];
 t q[4];
@@ -168,7 +160,6 @@ t q[4];
 cx q[4],q[3];
 cx q[5],q[4];
 cx q[3],q[5];
-h q[4];
 h q[3];
 t q[1];
 t q[0];
@@ -201,7 +192,6 @@ cx q[5],q[2];
 cx q[3],q[5];
 cx q[2],q[3];
 h q[5];
-h q[4];
 t q[5];
 t q[3];
 t q[4];
@@ -216,7 +206,6 @@ t q[4];
 cx q[4],q[3];
 cx q[5],q[4];
 cx q[3],q[5];
-h q[4];
 h q[3];
 t q[1];
 t q[0];
@@ -233,7 +222,6 @@ cx q[3],q[0];
 cx q[1],q[3];
 cx q[0],q[1];
 h q[3];
-h q[4];
 t q[5];
 t q[3];
 t q[4];
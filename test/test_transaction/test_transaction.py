@@ -0,0 +1,56 @@
+import sys
+sys.path.append('../../')
+
+from qcpm import Circuit, Mapper
+
+
+originOutput = sys.stdout
+print('Try candidates in transactions (apply -> measure -> roll back): \n')
+mapper = Mapper()
+
+# load circuit(system: IBM)
+circuit_path = '../data/data_ibm.qasm'
+circuit = Circuit(circuit_path)
+
+# collect candidates
+sys.stdout = None
+mapper.circuit = circuit
+mapper._candidates = []
+for pattern in mapper.patterns['IBM']:
+    mapper.find(pattern)
+
+
+file = open('transaction.txt', 'w')
+sys.stdout = file
+
+print(f'Try candidates on <{circuit_path}>: ')
+print(f'cycle: {circuit.cycle}, depth: {circuit.depth}\n')
+
+qasm = circuit.QASM
+best, best_cycle = None, circuit.cycle
+
+for candidate in mapper._candidates:
+    with circuit.transaction() as transaction:
+        candidate.apply(circuit, silence=True)
+
+        print(f'{candidate}  changes: {len(transaction)}, ' 
+            + f'cycle: {circuit.cycle}, depth: {circuit.depth}')
+        
+        if circuit.cycle < best_cycle:
+            best, best_cycle = candidate, circuit.cycle
+
+    # not committed => rolled back
+    assert circuit.QASM == qasm
+
+print(f'\nRolled back: {circuit.QASM == qasm}')
+
+# keep the best candidate
+with circuit.transaction() as transaction:
+    best.apply(circuit, silence=True)
+    transaction.commit()
+
+circuit.update()
+print(f'\nCommit: {best}')
+print(circuit.info)
+
+sys.stdout = originOutput